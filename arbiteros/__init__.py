@@ -9,25 +9,70 @@ __version__ = "0.1.0"
 __author__ = "ArbiterOS Team"
 __email__ = "team@arbiteros.dev"
 
-from .core.arbiter_graph import ArbiterGraph
-from .core.policy_engine import PolicyEngine, PolicyConfig, PolicyRule, PolicyRuleType
-from .core.instruction_binding import InstructionBinding, InstructionType, InstructionResult
-from .core.managed_state import ManagedState
-from .core.observability import FlightDataRecorder
+import os
+from typing import TYPE_CHECKING, Any, List
+
+# arbiteros.core loads its classes lazily, so this import is cheap
+from . import core as _core
+
+if TYPE_CHECKING:
+	from .core import (
+		ArbiterGraph,
+		PolicyEngine,
+		PolicyConfig,
+		PolicyRule,
+		PolicyRuleType,
+		InstructionBinding,
+		InstructionType,
+		InstructionResult,
+		ManagedState,
+		FlightDataRecorder,
+	)
+
+def __getattr__(name: str) -> Any:
+	# Core classes are resolved through arbiteros.core on first access (PEP 562)
+	if name not in _core.__all__:
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+	value = getattr(_core, name)
+	globals()[name] = value
+	return value
+
+def __dir__() -> List[str]:
+	return sorted(set(globals()) | set(_core.__all__))
 
 # Optional Redis checkpointer helper
-import os
+
+# RedisSaver class once imported (False if unavailable), and savers per URL
+_RedisSaver = None
+_redis_checkpointers = {}
 
 def build_redis_checkpointer_from_env():
-	"""Return a RedisSaver instance if REDIS_URL is set, else None."""
+	"""Return a RedisSaver instance if REDIS_URL is set, else None.
+
+	The import and the saver are cached per URL; failed connections are not
+	cached so a later call can retry.
+	"""
+	global _RedisSaver
+	url = os.getenv("REDIS_URL")
+	if not url:
+		return None
+	saver = _redis_checkpointers.get(url)
+	if saver is not None:
+		return saver
+	if _RedisSaver is None:
+		try:
+			from langgraph.checkpoint.redis import RedisSaver
+			_RedisSaver = RedisSaver
+		except Exception:
+			_RedisSaver = False
+	if _RedisSaver is False:
+		return None
 	try:
-		from langgraph.checkpoint.redis import RedisSaver
-		url = os.getenv("REDIS_URL")
-		if not url:
-			return None
-		return RedisSaver.from_url(url)
+		saver = _RedisSaver.from_url(url)
 	except Exception:
 		return None
+	_redis_checkpointers[url] = saver
+	return saver
 
 __all__ = [
 	"ArbiterGraph",
@@ -0,0 +1,413 @@
+"""Static analysis of LangGraph projects for the migration assistant.
+
+Kept free of CLI concerns so it can be imported on its own and, optionally,
+compiled with mypyc (see setup.py).
+"""
+
+import os
+import ast
+import copy
+import re
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Any, NamedTuple, Optional, Tuple
+from pathlib import Path
+
+# Below this many files the cost of starting worker processes outweighs the
+# parallel parse speedup.
+_PARALLEL_MIN_FILES = 32
+
+# Directories never worth descending into: caches, virtualenvs, vendored
+# dependencies and build output. Dot-directories (.git, .venv, .tox, ...) are
+# skipped separately.
+_PRUNED_DIRS = frozenset({
+    "__pycache__", "venv", "node_modules", "site-packages", "build", "dist",
+})
+
+# Node-type classifier. Each alternative is a lookahead anchored at the start
+# of the name, so categories are tried in priority order (a name matching both
+# GENERATE and TOOL_CALL keywords is GENERATE) and ``lastgroup`` names the winner.
+_NODE_TYPE_KEYWORDS = (
+    ("GENERATE", frozenset({"generate", "create", "write"})),
+    ("TOOL_CALL", frozenset({"call", "execute", "run", "tool"})),
+    ("VERIFY", frozenset({"verify", "check", "validate"})),
+    ("FALLBACK", frozenset({"fallback", "backup", "recover"})),
+    ("COMPRESS", frozenset({"compress", "summarize", "reduce"})),
+)
+_NODE_TYPE_PATTERN = re.compile(
+    "|".join(
+        f"(?=.*?(?:{'|'.join(sorted(keywords))}))(?P<{node_type}>)"
+        for node_type, keywords in _NODE_TYPE_KEYWORDS
+    ),
+    re.DOTALL,
+)
+
+# (node_functions, graph_definitions, error message) for a single file
+_FileResult = Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Optional[str]]
+
+# (path, mtime_ns, size) identifying one version of a file
+_CacheKey = Tuple[str, int, int]
+
+# Per-file results shared by every analyzer in this process, so re-running
+# on an unchanged project skips reading and parsing. Least recently used
+# entries are evicted beyond _RESULT_CACHE_SIZE.
+_RESULT_CACHE_SIZE = 4096
+_result_cache: "OrderedDict[_CacheKey, _FileResult]" = OrderedDict()
+
+
+class Recommendation(NamedTuple):
+    """A single migration recommendation."""
+    
+    type: str
+    severity: str
+    message: str
+    suggestion: str
+
+
+def _scan_dir(path: str) -> Tuple[List[str], List[str]]:
+    """Return the ``.py`` files and subdirectories directly under ``path``."""
+    files: List[str] = []
+    subdirs: List[str] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _PRUNED_DIRS:
+                        subdirs.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    files.append(entry.path)
+    except OSError:
+        pass
+    return files, subdirs
+
+
+def _call_name(node: ast.Call) -> Optional[str]:
+    """Return the called name for ``f(...)`` or ``obj.f(...)`` calls."""
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    if isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    return None
+
+
+class _DefinitionCollector(ast.NodeVisitor):
+    """Single-pass collector of function/class definitions and their calls.
+    
+    Every call is attributed to all enclosing functions, matching what an
+    ``ast.walk`` over each function body would find. Results are returned in
+    ``ast.walk``'s breadth-first order, which is (depth, pre-order position).
+    """
+    
+    def __init__(self) -> None:
+        self._functions: List[Tuple[int, int, ast.FunctionDef]] = []
+        self._classes: List[Tuple[int, int, ast.ClassDef]] = []
+        self._calls: Dict[int, List[Tuple[int, int, str]]] = {}
+        self._enclosing: List[List[Tuple[int, int, str]]] = []
+        self._depth = 0
+        self._seq = 0
+    
+    def visit(self, node: ast.AST) -> None:
+        self._depth += 1
+        self._seq += 1
+        super().visit(node)
+        self._depth -= 1
+    
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self._functions.append((self._depth, self._seq, node))
+        calls: List[Tuple[int, int, str]] = []
+        self._calls[id(node)] = calls
+        self._enclosing.append(calls)
+        self.generic_visit(node)
+        self._enclosing.pop()
+    
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self._classes.append((self._depth, self._seq, node))
+        self.generic_visit(node)
+    
+    def visit_Call(self, node: ast.Call) -> None:
+        if self._enclosing:
+            name = _call_name(node)
+            if name is not None:
+                entry = (self._depth, self._seq, name)
+                for calls in self._enclosing:
+                    calls.append(entry)
+        self.generic_visit(node)
+    
+    @property
+    def functions(self) -> List[ast.FunctionDef]:
+        return [node for _, _, node in sorted(self._functions, key=_walk_order)]
+    
+    @property
+    def classes(self) -> List[ast.ClassDef]:
+        return [node for _, _, node in sorted(self._classes, key=_walk_order)]
+    
+    @property
+    def calls_by_function(self) -> Dict[int, List[str]]:
+        return {
+            key: [name for _, _, name in sorted(calls, key=_walk_order)]
+            for key, calls in self._calls.items()
+        }
+
+
+def _walk_order(entry: Tuple[int, int, Any]) -> Tuple[int, int]:
+    """Sort key putting collected nodes in ``ast.walk`` order."""
+    return entry[0], entry[1]
+
+
+class LangGraphAnalyzer:
+    """Analyzer for LangGraph projects."""
+    
+    def __init__(self, project_path: str) -> None:
+        self.project_path = Path(project_path)
+        self.python_files: List[Path] = []
+        self.graph_definitions: List[Dict[str, Any]] = []
+        self.node_functions: List[Dict[str, Any]] = []
+        # (file, message) for every file that could not be analyzed
+        self.errors: List[Tuple[str, str]] = []
+        # Call names per FunctionDef (keyed by id) for the file being analyzed
+        self._calls_by_function: Dict[int, List[str]] = {}
+        
+    def analyze_project(self) -> Dict[str, Any]:
+        """Analyze the LangGraph project.
+        
+        Files that fail to read or parse are skipped and listed in ``errors``.
+        """
+        # Find Python files
+        self._find_python_files()
+        
+        # Analyze each file, reusing cached results for unchanged ones
+        keys = [_cache_key(f) for f in self.python_files]
+        cached = [_cache_get(k) for k in keys]
+        fresh = iter(self._analyze_files(
+            [f for f, hit in zip(self.python_files, cached) if hit is None]
+        ))
+        results: List[_FileResult] = []
+        for key, hit in zip(keys, cached):
+            if hit is None:
+                hit = next(fresh)
+                if hit[2] is None:
+                    _cache_put(key, hit)
+            results.append(hit)
+        self._collect_results(results)
+        
+        return {
+            "project_path": str(self.project_path),
+            "python_files": [str(f) for f in self.python_files],
+            "graph_definitions": self.graph_definitions,
+            "node_functions": self.node_functions,
+            # Plain dicts at the API boundary, so the analysis stays JSON-ready
+            "recommendations": [rec._asdict() for rec in self._generate_recommendations()]
+        }
+    
+    def _analyze_files(self, files: List[Path]) -> List[_FileResult]:
+        """Analyze ``files``, in parallel once there are enough of them."""
+        if len(files) < _PARALLEL_MIN_FILES:
+            # Read files ahead on a few threads while this thread parses
+            with ThreadPoolExecutor(max_workers=4) as reader:
+                sources = reader.map(_read_source, files)
+                return list(map(_analyze_file_worker, files, sources))
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(_analyze_file_worker, files, chunksize=16))
+    
+    def _find_python_files(self) -> None:
+        """Find all Python files in the project.
+
+        Directories are scanned level by level on a thread pool so that the
+        readdir/stat latency of sibling directories overlaps.
+        """
+        found: List[Path] = []
+        pending = [str(self.project_path)]
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+            while pending:
+                next_level: List[str] = []
+                for files, subdirs in executor.map(_scan_dir, pending):
+                    found.extend(Path(f) for f in files)
+                    next_level.extend(subdirs)
+                pending = next_level
+        found.sort()
+        self.python_files.extend(found)
+    
+    def _collect_results(self, results: Iterable[_FileResult]) -> None:
+        """Merge per-file worker results, in file order."""
+        for file_path, (nodes, graphs, error) in zip(self.python_files, results):
+            if error is not None:
+                self.errors.append((str(file_path), error))
+                continue
+            self.node_functions.extend(nodes)
+            self.graph_definitions.extend(graphs)
+    
+    def _analyze_file(self, file_path: Path, source: Optional[bytes] = None) -> None:
+        """Analyze a single Python file, optionally from already-read bytes."""
+        # compile() takes the raw bytes directly, skipping a separate decode pass
+        if source is None:
+            source = file_path.read_bytes()
+        tree: ast.AST = compile(source, str(file_path), "exec", flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+        
+        collector = _DefinitionCollector()
+        collector.visit(tree)
+        
+        self._calls_by_function = collector.calls_by_function
+        try:
+            for function in collector.functions:
+                self._analyze_function(function, file_path)
+            for cls in collector.classes:
+                self._analyze_class(cls, file_path)
+        finally:
+            self._calls_by_function = {}
+    
+    def _analyze_function(self, node: ast.FunctionDef, file_path: Path) -> None:
+        """Analyze a function definition."""
+        # Check if this looks like a LangGraph node function
+        if self._is_langgraph_node(node):
+            self.node_functions.append({
+                "name": node.name,
+                "file": str(file_path),
+                "line": node.lineno,
+                "type": self._classify_node_type(node),
+                "dependencies": self._extract_dependencies(node)
+            })
+    
+    def _analyze_class(self, node: ast.ClassDef, file_path: Path) -> None:
+        """Analyze a class definition."""
+        methods = [method.name for method in node.body if isinstance(method, ast.FunctionDef)]
+        
+        # Check if this looks like a StateGraph definition
+        if self._is_state_graph_class(node, methods):
+            self.graph_definitions.append({
+                "name": node.name,
+                "file": str(file_path),
+                "line": node.lineno,
+                "methods": methods
+            })
+    
+    def _is_langgraph_node(self, node: ast.FunctionDef) -> bool:
+        """Check if a function looks like a LangGraph node."""
+        # Look for common patterns
+        if node.name.startswith("_"):
+            return False
+        
+        # Check for state parameter
+        args = [arg.arg for arg in node.args.args]
+        if "state" in args or len(args) == 1:
+            return True
+        
+        return False
+    
+    def _is_state_graph_class(self, node: ast.ClassDef, method_names: List[str]) -> bool:
+        """Check if a class looks like a StateGraph."""
+        # Look for StateGraph in base classes or methods
+        for base in node.bases:
+            if isinstance(base, ast.Name) and "StateGraph" in base.id:
+                return True
+        
+        # Look for common StateGraph methods
+        if any(name in method_names for name in ["add_node", "add_edge", "compile"]):
+            return True
+        
+        return False
+    
+    def _classify_node_type(self, node: ast.FunctionDef) -> str:
+        """Classify the type of node function."""
+        match = _NODE_TYPE_PATTERN.match(node.name.lower())
+        if match is None or match.lastgroup is None:
+            return "UNKNOWN"
+        return match.lastgroup
+    
+    def _extract_dependencies(self, node: ast.FunctionDef) -> List[str]:
+        """Extract dependencies from a function."""
+        indexed = self._calls_by_function.get(id(node))
+        if indexed is not None:
+            return indexed
+        
+        dependencies: List[str] = []
+        for child in ast.walk(node):
+            if isinstance(child, ast.Call):
+                name = _call_name(child)
+                if name is not None:
+                    dependencies.append(name)
+        
+        return dependencies
+    
+    def _generate_recommendations(self) -> List[Recommendation]:
+        """Generate migration recommendations."""
+        recommendations: List[Recommendation] = []
+        node_types = Counter(node["type"] for node in self.node_functions)
+        has_verify = node_types["VERIFY"] > 0
+        
+        # Check for missing governance
+        if not has_verify:
+            recommendations.append(Recommendation(
+                type="missing_verification",
+                severity="high",
+                message="No verification nodes found. Consider adding VERIFY instructions.",
+                suggestion="Add verification steps after GENERATE instructions"
+            ))
+        
+        # Check for direct GENERATE -> TOOL_CALL flows
+        if node_types["GENERATE"] and node_types["TOOL_CALL"] and not has_verify:
+            recommendations.append(Recommendation(
+                type="unsafe_flow",
+                severity="critical",
+                message="Direct GENERATE -> TOOL_CALL flow detected without verification",
+                suggestion="Add VERIFY instructions between GENERATE and TOOL_CALL"
+            ))
+        
+        # Check for missing fallback mechanisms
+        if not node_types["FALLBACK"]:
+            recommendations.append(Recommendation(
+                type="missing_fallback",
+                severity="medium",
+                message="No fallback mechanisms found",
+                suggestion="Add FALLBACK instructions for error recovery"
+            ))
+        
+        return recommendations
+
+
+def _cache_key(file_path: Path) -> Optional[_CacheKey]:
+    """Return the result cache key for ``file_path``, or None if it can't be stat'ed."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return str(file_path), st.st_mtime_ns, st.st_size
+
+
+def _cache_get(key: Optional[_CacheKey]) -> Optional[_FileResult]:
+    """Return a private copy of the cached result for ``key``, if any."""
+    if key is None:
+        return None
+    hit = _result_cache.get(key)
+    if hit is None:
+        return None
+    _result_cache.move_to_end(key)
+    return copy.deepcopy(hit)
+
+
+def _cache_put(key: Optional[_CacheKey], result: _FileResult) -> None:
+    """Remember a successful result for ``key``, evicting the oldest entries."""
+    if key is None:
+        return
+    _result_cache[key] = copy.deepcopy(result)
+    while len(_result_cache) > _RESULT_CACHE_SIZE:
+        _result_cache.popitem(last=False)
+
+
+def _read_source(file_path: Path) -> Optional[bytes]:
+    """Read a file for readahead; errors are left for the analyzer to report."""
+    try:
+        return file_path.read_bytes()
+    except OSError:
+        return None
+
+
+def _analyze_file_worker(file_path: Path, source: Optional[bytes] = None) -> _FileResult:
+    """Analyze one file in isolation; safe to run in a worker process."""
+    analyzer = LangGraphAnalyzer(str(file_path.parent))
+    try:
+        analyzer._analyze_file(file_path, source)
+    except Exception as e:
+        return [], [], str(e)
+    return analyzer.node_functions, analyzer.graph_definitions, None
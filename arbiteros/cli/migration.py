@@ -1,215 +1,15 @@
 """Migration assistant CLI tool for converting LangGraph projects to ArbiterOS."""
 
-import os
-import ast
 import json
-from typing import Dict, List, Any, Optional
+from typing import Dict, Any
 from pathlib import Path
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from .analyzer import LangGraphAnalyzer
 
-console = Console()
 
-
-class LangGraphAnalyzer:
-    """Analyzer for LangGraph projects."""
-    
-    def __init__(self, project_path: str):
-        self.project_path = Path(project_path)
-        self.python_files: List[Path] = []
-        self.graph_definitions: List[Dict[str, Any]] = []
-        self.node_functions: List[Dict[str, Any]] = []
-        
-    def analyze_project(self) -> Dict[str, Any]:
-        """Analyze the LangGraph project."""
-        console.print("🔍 Analyzing LangGraph project...")
-        
-        # Find Python files
-        self._find_python_files()
-        
-        # Analyze each file
-        for file_path in self.python_files:
-            self._analyze_file(file_path)
-        
-        return {
-            "project_path": str(self.project_path),
-            "python_files": [str(f) for f in self.python_files],
-            "graph_definitions": self.graph_definitions,
-            "node_functions": self.node_functions,
-            "recommendations": self._generate_recommendations()
-        }
-    
-    def _find_python_files(self) -> None:
-        """Find all Python files in the project."""
-        for file_path in self.project_path.rglob("*.py"):
-            if not file_path.name.startswith("."):
-                self.python_files.append(file_path)
-    
-    def _analyze_file(self, file_path: Path) -> None:
-        """Analyze a single Python file."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            tree = ast.parse(content)
-            
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    self._analyze_function(node, file_path)
-                elif isinstance(node, ast.ClassDef):
-                    self._analyze_class(node, file_path)
-                    
-        except Exception as e:
-            console.print(f"⚠️  Error analyzing {file_path}: {e}")
-    
-    def _analyze_function(self, node: ast.FunctionDef, file_path: Path) -> None:
-        """Analyze a function definition."""
-        # Check if this looks like a LangGraph node function
-        if self._is_langgraph_node(node):
-            self.node_functions.append({
-                "name": node.name,
-                "file": str(file_path),
-                "line": node.lineno,
-                "type": self._classify_node_type(node),
-                "dependencies": self._extract_dependencies(node)
-            })
-    
-    def _analyze_class(self, node: ast.ClassDef, file_path: Path) -> None:
-        """Analyze a class definition."""
-        # Check if this looks like a StateGraph definition
-        if self._is_state_graph_class(node):
-            self.graph_definitions.append({
-                "name": node.name,
-                "file": str(file_path),
-                "line": node.lineno,
-                "methods": [method.name for method in node.body if isinstance(method, ast.FunctionDef)]
-            })
-    
-    def _is_langgraph_node(self, node: ast.FunctionDef) -> bool:
-        """Check if a function looks like a LangGraph node."""
-        # Look for common patterns
-        if node.name.startswith("_"):
-            return False
-        
-        # Check for state parameter
-        args = [arg.arg for arg in node.args.args]
-        if "state" in args or len(args) == 1:
-            return True
-        
-        return False
-    
-    def _is_state_graph_class(self, node: ast.ClassDef) -> bool:
-        """Check if a class looks like a StateGraph."""
-        # Look for StateGraph in base classes or methods
-        for base in node.bases:
-            if isinstance(base, ast.Name) and "StateGraph" in base.id:
-                return True
-        
-        # Look for common StateGraph methods
-        method_names = [method.name for method in node.body if isinstance(method, ast.FunctionDef)]
-        if any(name in method_names for name in ["add_node", "add_edge", "compile"]):
-            return True
-        
-        return False
-    
-    def _classify_node_type(self, node: ast.FunctionDef) -> str:
-        """Classify the type of node function."""
-        name_lower = node.name.lower()
-        
-        if any(keyword in name_lower for keyword in ["generate", "create", "write"]):
-            return "GENERATE"
-        elif any(keyword in name_lower for keyword in ["call", "execute", "run", "tool"]):
-            return "TOOL_CALL"
-        elif any(keyword in name_lower for keyword in ["verify", "check", "validate"]):
-            return "VERIFY"
-        elif any(keyword in name_lower for keyword in ["fallback", "backup", "recover"]):
-            return "FALLBACK"
-        elif any(keyword in name_lower for keyword in ["compress", "summarize", "reduce"]):
-            return "COMPRESS"
-        else:
-            return "UNKNOWN"
-    
-    def _extract_dependencies(self, node: ast.FunctionDef) -> List[str]:
-        """Extract dependencies from a function."""
-        dependencies = []
-        
-        for child in ast.walk(node):
-            if isinstance(child, ast.Call):
-                if isinstance(child.func, ast.Name):
-                    dependencies.append(child.func.id)
-                elif isinstance(child.func, ast.Attribute):
-                    dependencies.append(child.func.attr)
-        
-        return dependencies
-    
-    def _generate_recommendations(self) -> List[Dict[str, Any]]:
-        """Generate migration recommendations."""
-        recommendations = []
-        
-        # Check for missing governance
-        if not any(node["type"] == "VERIFY" for node in self.node_functions):
-            recommendations.append({
-                "type": "missing_verification",
-                "severity": "high",
-                "message": "No verification nodes found. Consider adding VERIFY instructions.",
-                "suggestion": "Add verification steps after GENERATE instructions"
-            })
-        
-        # Check for direct GENERATE -> TOOL_CALL flows
-        generate_nodes = [node for node in self.node_functions if node["type"] == "GENERATE"]
-        tool_call_nodes = [node for node in self.node_functions if node["type"] == "TOOL_CALL"]
-        
-        if generate_nodes and tool_call_nodes and not any(node["type"] == "VERIFY" for node in self.node_functions):
-            recommendations.append({
-                "type": "unsafe_flow",
-                "severity": "critical",
-                "message": "Direct GENERATE -> TOOL_CALL flow detected without verification",
-                "suggestion": "Add VERIFY instructions between GENERATE and TOOL_CALL"
-            })
-        
-        # Check for missing fallback mechanisms
-        if not any(node["type"] == "FALLBACK" for node in self.node_functions):
-            recommendations.append({
-                "type": "missing_fallback",
-                "severity": "medium",
-                "message": "No fallback mechanisms found",
-                "suggestion": "Add FALLBACK instructions for error recovery"
-            })
-        
-        return recommendations
-
-
-class ArbiterOSGenerator:
-    """Generator for ArbiterOS code."""
-    
-    def __init__(self, analysis: Dict[str, Any]):
-        self.analysis = analysis
-    
-    def generate_migration_code(self) -> Dict[str, str]:
-        """Generate ArbiterOS migration code."""
-        generated_files = {}
-        
-        # Generate main ArbiterOS file
-        generated_files["arbiteros_agent.py"] = self._generate_main_agent()
-        
-        # Generate policy configuration
-        generated_files["policy_config.py"] = self._generate_policy_config()
-        
-        # Generate instruction bindings
-        generated_files["instruction_bindings.py"] = self._generate_instruction_bindings()
-        
-        # Generate example usage
-        generated_files["example_usage.py"] = self._generate_example_usage()
-        
-        return generated_files
-    
-    def _generate_main_agent(self) -> str:
-        """Generate the main ArbiterOS agent file."""
-        return '''"""
+# Templates for the generated migration project
+_MAIN_AGENT_TEMPLATE = '''"""
 ArbiterOS Agent - Generated from LangGraph project.
 """
 
@@ -262,10 +62,9 @@ if __name__ == "__main__":
     print("Execution completed!")
     print(f"Final state: {result.get_state_summary()}")
 '''
-    
-    def _generate_policy_config(self) -> str:
-        """Generate policy configuration file."""
-        return '''"""
+
+
+_POLICY_CONFIG_TEMPLATE = '''"""
 Policy configuration for ArbiterOS agent.
 """
 
@@ -318,10 +117,9 @@ def get_policy_config():
         strict_mode=True
     )
 '''
-    
-    def _generate_instruction_bindings(self) -> str:
-        """Generate instruction bindings file."""
-        return '''"""
+
+
+_INSTRUCTION_BINDINGS_TEMPLATE = '''"""
 Instruction bindings for ArbiterOS agent.
 """
 
@@ -396,10 +194,9 @@ def get_instruction_bindings() -> List[InstructionBinding]:
         # TODO: Add more instruction bindings as needed
     ]
 '''
-    
-    def _generate_example_usage(self) -> str:
-        """Generate example usage file."""
-        return '''"""
+
+
+_EXAMPLE_USAGE_TEMPLATE = '''"""
 Example usage of the ArbiterOS agent.
 """
 
@@ -436,13 +233,114 @@ if __name__ == "__main__":
 '''
 
 
+_REQUIREMENTS_TEMPLATE = """# ArbiterOS requirements
+arbiteros-core>=0.1.0
+langgraph>=0.2.0
+langchain>=0.3.0
+pydantic>=2.0.0
+"""
+
+
+_README_TEMPLATE = """# ArbiterOS Migration
+
+This project has been migrated from LangGraph to ArbiterOS.
+
+## Generated Files
+
+- `arbiteros_agent.py` - Main ArbiterOS agent implementation
+- `policy_config.py` - Policy configuration
+- `instruction_bindings.py` - Instruction bindings
+- `example_usage.py` - Example usage
+
+## Usage
+
+```python
+from arbiteros_agent import create_arbiter_agent
+
+# Create the agent
+agent = create_arbiter_agent()
+
+# Execute with initial state
+result = agent.execute({{
+    "prompt": "Your prompt here",
+    "tool_name": "your_tool",
+    "parameters": {{"key": "value"}}
+}})
+
+print("Execution completed!")
+print(f"Final state: {{result.get_state_summary()}}")
+```
+
+## Next Steps
+
+1. Review the generated code
+2. Implement your instruction functions
+3. Define your execution flow
+4. Test the agent
+5. Customize policies as needed
+
+## Migration Notes
+
+{recommendation_count} recommendations were generated during migration.
+Please review and address them as needed.
+"""
+
+
+class ArbiterOSGenerator:
+    """Generator for ArbiterOS code."""
+    
+    def __init__(self, analysis: Dict[str, Any]) -> None:
+        self.analysis = analysis
+    
+    def generate_migration_code(self) -> Dict[str, str]:
+        """Generate ArbiterOS migration code."""
+        generated_files = {}
+        
+        # Generate main ArbiterOS file
+        generated_files["arbiteros_agent.py"] = self._generate_main_agent()
+        
+        # Generate policy configuration
+        generated_files["policy_config.py"] = self._generate_policy_config()
+        
+        # Generate instruction bindings
+        generated_files["instruction_bindings.py"] = self._generate_instruction_bindings()
+        
+        # Generate example usage
+        generated_files["example_usage.py"] = self._generate_example_usage()
+        
+        return generated_files
+    
+    def _generate_main_agent(self) -> str:
+        """Generate the main ArbiterOS agent file."""
+        return _MAIN_AGENT_TEMPLATE
+    
+    def _generate_policy_config(self) -> str:
+        """Generate policy configuration file."""
+        return _POLICY_CONFIG_TEMPLATE
+    
+    def _generate_instruction_bindings(self) -> str:
+        """Generate instruction bindings file."""
+        return _INSTRUCTION_BINDINGS_TEMPLATE
+    
+    def _generate_example_usage(self) -> str:
+        """Generate example usage file."""
+        return _EXAMPLE_USAGE_TEMPLATE
+
+
 @click.command()
 @click.argument('project_path', type=click.Path(exists=True))
 @click.option('--output-dir', '-o', default='./arbiteros_migration', 
               help='Output directory for generated files')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
-def main(project_path: str, output_dir: str, verbose: bool):
+def main(project_path: str, output_dir: str, verbose: bool) -> None:
     """ArbiterOS Migration Assistant - Convert LangGraph projects to ArbiterOS."""
+    # rich is only needed for the interactive output, so import it here
+    from rich.console import Console
+    from rich.table import Table
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    
+    console = Console()
     
     console.print(Panel.fit(
         "[bold blue]ArbiterOS Migration Assistant[/bold blue]\n"
@@ -458,11 +356,15 @@ def main(project_path: str, output_dir: str, verbose: bool):
     ) as progress:
         task = progress.add_task("Analyzing project...", total=None)
         
+        console.print("🔍 Analyzing LangGraph project...")
         analyzer = LangGraphAnalyzer(project_path)
         analysis = analyzer.analyze_project()
         
         progress.update(task, description="Analysis complete!")
     
+    for file_path, error in analyzer.errors:
+        console.print(f"⚠️  Error analyzing {file_path}: {error}")
+    
     # Display analysis results
     console.print("\n[bold green]Analysis Results:[/bold green]")
     
@@ -508,74 +410,18 @@ def main(project_path: str, output_dir: str, verbose: bool):
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
     
-    # Write generated files
-    for filename, content in generated_files.items():
-        file_path = output_path / filename
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        console.print(f"  ✓ Generated {filename}")
-    
     # Create requirements.txt
-    requirements_content = """# ArbiterOS requirements
-arbiteros-core>=0.1.0
-langgraph>=0.2.0
-langchain>=0.3.0
-pydantic>=2.0.0
-"""
-    requirements_path = output_path / "requirements.txt"
-    with open(requirements_path, 'w') as f:
-        f.write(requirements_content)
-    console.print("  ✓ Generated requirements.txt")
+    generated_files["requirements.txt"] = _REQUIREMENTS_TEMPLATE
     
     # Create README
-    readme_content = f"""# ArbiterOS Migration
-
-This project has been migrated from LangGraph to ArbiterOS.
-
-## Generated Files
-
-- `arbiteros_agent.py` - Main ArbiterOS agent implementation
-- `policy_config.py` - Policy configuration
-- `instruction_bindings.py` - Instruction bindings
-- `example_usage.py` - Example usage
-
-## Usage
-
-```python
-from arbiteros_agent import create_arbiter_agent
-
-# Create the agent
-agent = create_arbiter_agent()
-
-# Execute with initial state
-result = agent.execute({{
-    "prompt": "Your prompt here",
-    "tool_name": "your_tool",
-    "parameters": {{"key": "value"}}
-}})
-
-print("Execution completed!")
-print(f"Final state: {{result.get_state_summary()}}")
-```
-
-## Next Steps
-
-1. Review the generated code
-2. Implement your instruction functions
-3. Define your execution flow
-4. Test the agent
-5. Customize policies as needed
-
-## Migration Notes
-
-{len(analysis['recommendations'])} recommendations were generated during migration.
-Please review and address them as needed.
-"""
+    generated_files["README.md"] = _README_TEMPLATE.format_map(
+        {"recommendation_count": len(analysis["recommendations"])}
+    )
     
-    readme_path = output_path / "README.md"
-    with open(readme_path, 'w') as f:
-        f.write(readme_content)
-    console.print("  ✓ Generated README.md")
+    # Write generated files
+    for filename, content in generated_files.items():
+        (output_path / filename).write_text(content, encoding="utf-8")
+        console.print(f"  ✓ Generated {filename}")
     
     console.print(f"\n[bold green]Migration complete![/bold green]")
     console.print(f"Generated files in: {output_path.absolute()}")
@@ -5,6 +5,7 @@ A reusable governed subgraph pattern:
 This is a lightweight, copy-pastable component to speed up adoption.
 """
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel
 
@@ -45,6 +46,41 @@ def default_verify_impl(state: VerifyInput) -> Dict[str, Any]:
 	return {"passed": ok, "confidence": conf, "reason": "ok" if ok else "low_signal"}
 
 
+_DEFAULT_RULES: List[PolicyRule] = [
+	PolicyRule(
+		rule_id="require_verify_before_tool",
+		rule_type=PolicyRuleType.SEMANTIC_SAFETY,
+		description="Encourage GENERATE/VERIFY before TOOL_CALL",
+		condition={"allowed_flows": ["GENERATE->VERIFY->TOOL_CALL", "VERIFY->TOOL_CALL"]},
+		action="LOG",
+		severity="warning",
+		applies_to=["TOOL_CALL"],
+	)
+]
+
+
+@lru_cache(maxsize=32)
+def _policy(policy_id: str, description: str) -> PolicyConfig:
+	# Shared between executors with the same id/description; treat as read-only.
+	return PolicyConfig(policy_id=policy_id, description=description, rules=_DEFAULT_RULES)
+
+
+def _verify_binding(verify_impl) -> InstructionBinding:
+	return InstructionBinding(
+		id="verify",
+		instruction_type=InstructionType.VERIFY,
+		input_schema=VerifyInput,
+		output_schema=VerifyOutput,
+		implementation=verify_impl,
+		description="Verify content signal",
+	)
+
+
+@lru_cache(maxsize=1)
+def _default_verify_binding() -> InstructionBinding:
+	return _verify_binding(default_verify_impl)
+
+
 def build_resilient_executor(
 	verify_impl=default_verify_impl,
 	tool_impl=None,
@@ -57,28 +93,12 @@ def build_resilient_executor(
 	if tool_impl is None:
 		raise ValueError("tool_impl is required")
 
-	rules: List[PolicyRule] = [
-		PolicyRule(
-			rule_id="require_verify_before_tool",
-			rule_type=PolicyRuleType.SEMANTIC_SAFETY,
-			description="Encourage GENERATE/VERIFY before TOOL_CALL",
-			condition={"allowed_flows": ["GENERATE->VERIFY->TOOL_CALL", "VERIFY->TOOL_CALL"]},
-			action="LOG",
-			severity="warning",
-			applies_to=["TOOL_CALL"],
-		)
-	]
-	policy = PolicyConfig(policy_id=policy_id, description=description, rules=rules)
-	ag = ArbiterGraph(policy_config=policy, enable_observability=True)
-
-	verify = InstructionBinding(
-		id="verify",
-		instruction_type=InstructionType.VERIFY,
-		input_schema=VerifyInput,
-		output_schema=VerifyOutput,
-		implementation=verify_impl,
-		description="Verify content signal",
-	)
+	ag = ArbiterGraph(policy_config=_policy(policy_id, description), enable_observability=True)
+
+	if verify_impl is default_verify_impl:
+		verify = _default_verify_binding()
+	else:
+		verify = _verify_binding(verify_impl)
 
 	tool = InstructionBinding(
 		id="tool",
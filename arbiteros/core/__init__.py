@@ -1,10 +1,42 @@
 """Core ArbiterOS components."""
 
-from .arbiter_graph import ArbiterGraph
-from .policy_engine import PolicyEngine, PolicyConfig, PolicyRule, PolicyRuleType
-from .instruction_binding import InstructionBinding, InstructionType, InstructionResult
-from .managed_state import ManagedState
-from .observability import FlightDataRecorder
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .arbiter_graph import ArbiterGraph
+    from .policy_engine import PolicyEngine, PolicyConfig, PolicyRule, PolicyRuleType
+    from .instruction_binding import InstructionBinding, InstructionType, InstructionResult
+    from .managed_state import ManagedState
+    from .observability import FlightDataRecorder
+
+# Submodules are imported on first attribute access (PEP 562)
+_LAZY_ATTRS = {
+    "ArbiterGraph": ".arbiter_graph",
+    "PolicyEngine": ".policy_engine",
+    "PolicyConfig": ".policy_engine",
+    "PolicyRule": ".policy_engine",
+    "PolicyRuleType": ".policy_engine",
+    "InstructionBinding": ".instruction_binding",
+    "InstructionType": ".instruction_binding",
+    "InstructionResult": ".instruction_binding",
+    "ManagedState": ".managed_state",
+    "FlightDataRecorder": ".observability",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     "ArbiterGraph",
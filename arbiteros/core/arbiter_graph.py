@@ -1,6 +1,6 @@
 """ArbiterGraph - The core governance layer for LangGraph."""
 
-from typing import Any, Dict, List, Optional, Callable, Union
+from typing import Any, Dict, List, Optional, Callable, Tuple, Union
 import time
 import logging
 from datetime import datetime
@@ -8,12 +8,20 @@ from datetime import datetime
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.base import BaseCheckpointSaver
 
-from .policy_engine import PolicyEngine, PolicyConfig
+from .policy_engine import PolicyEngine, PolicyConfig, VIOLATION_CRITICAL, VIOLATION_FALLBACK
 from .instruction_binding import InstructionBinding, InstructionType, InstructionResult
 from .managed_state import ManagedState
 from .observability import FlightDataRecorder
 
 
+# Instruction types whose failures may be handed to a FALLBACK instruction
+_FALLBACK_ELIGIBLE = frozenset({InstructionType.TOOL_CALL, InstructionType.GENERATE})
+
+
+def _skip_state_validation(state: ManagedState) -> None:
+	"""Stand-in for state validation when debug mode is off."""
+
+
 class ArbiterGraph:
 	"""
 	ArbiterGraph - The symbolic governor for LangGraph-based agents.
@@ -22,6 +30,9 @@ class ArbiterGraph:
 	implementing the "Kernel-as-Governor" paradigm from the ArbiterOS paper.
 	"""
 	
+	# Called after every step; bound by the debug setter
+	_validate_state_if_debug: Callable[[ManagedState], None]
+	
 	def __init__(
 		self,
 		policy_config: PolicyConfig,
@@ -59,15 +70,30 @@ class ArbiterGraph:
 		# Initialize the underlying LangGraph
 		self.graph = StateGraph(ManagedState)
 		self.instruction_bindings: Dict[str, InstructionBinding] = {}
+		# Same bindings grouped by instruction type, in registration order
+		self._bindings_by_type: Dict[InstructionType, Dict[str, InstructionBinding]] = {}
 		self.execution_id: Optional[str] = None
+		# Compiled graph and the checkpointer it was compiled with
+		self._compiled: Optional[Tuple[Any, Any]] = None
 		
 		# Register the central arbiter
 		self.graph.add_node("arbiter", self._arbiter_function)
 	
-	def _validate_state_if_debug(self, state: ManagedState) -> None:
-		"""Re-validate ManagedState when debug mode is enabled."""
-		if not self.debug:
-			return
+	@property
+	def debug(self) -> bool:
+		"""Whether ManagedState is strictly re-validated after each step."""
+		return self._debug
+	
+	@debug.setter
+	def debug(self, value: bool) -> None:
+		self._debug = value
+		# Rebind rather than branch per step, so production graphs pay no check
+		self._validate_state_if_debug = (
+			self._validate_state_strict if value else _skip_state_validation
+		)
+	
+	def _validate_state_strict(self, state: ManagedState) -> None:
+		"""Re-validate ManagedState (debug mode)."""
 		# Round-trip through dict -> model to catch contract issues early
 		try:
 			_ = ManagedState.from_dict(state.to_dict())
@@ -86,7 +112,12 @@ class ArbiterGraph:
 			binding: Instruction binding to add
 			dependencies: List of instruction IDs this depends on
 		"""
+		previous = self.instruction_bindings.get(binding.id)
+		if previous is not None and previous.instruction_type != binding.instruction_type:
+			del self._bindings_by_type[previous.instruction_type][binding.id]
 		self.instruction_bindings[binding.id] = binding
+		self._bindings_by_type.setdefault(binding.instruction_type, {})[binding.id] = binding
+		self._compiled = None
 		
 		# Create a wrapped function for the instruction
 		def instruction_wrapper(state: ManagedState) -> ManagedState:
@@ -105,6 +136,7 @@ class ArbiterGraph:
 		"""Add an edge between instructions."""
 		if from_instruction in self.instruction_bindings and to_instruction in self.instruction_bindings:
 			self.graph.add_edge(from_instruction, to_instruction)
+			self._compiled = None
 		else:
 			raise ValueError(f"One or both instructions not found: {from_instruction} -> {to_instruction}")
 	
@@ -113,16 +145,28 @@ class ArbiterGraph:
 		if instruction_id not in self.instruction_bindings:
 			raise ValueError(f"Instruction not found: {instruction_id}")
 		self.graph.set_entry_point(instruction_id)
+		self._compiled = None
 	
 	def set_finish_point(self, instruction_id: str) -> None:
 		"""Set the finish point for the graph."""
 		if instruction_id not in self.instruction_bindings:
 			raise ValueError(f"Instruction not found: {instruction_id}")
 		self.graph.add_edge(instruction_id, END)
+		self._compiled = None
 	
 	def compile(self) -> Any:
-		"""Compile the graph for execution."""
-		return self.graph.compile(checkpointer=self.checkpoint_saver)
+		"""Compile the graph for execution.
+		
+		The result is reused by later calls (and executions) until an
+		instruction, edge, entry or finish point is added, or the checkpoint
+		saver is replaced. Changes made on self.graph directly bypass this.
+		"""
+		if self._compiled is None or self._compiled[0] is not self.checkpoint_saver:
+			self._compiled = (
+				self.checkpoint_saver,
+				self.graph.compile(checkpointer=self.checkpoint_saver),
+			)
+		return self._compiled[1]
 	
 	def _arbiter_function(self, state: ManagedState) -> ManagedState:
 		"""
@@ -133,13 +177,15 @@ class ArbiterGraph:
 		"""
 		if not self.execution_id:
 			self.execution_id = state.os_metadata.execution_id
+		execution_id = self.execution_id
+		fr = self.flight_recorder
 		
 		# Record arbiter activation
-		if self.flight_recorder:
-			self.flight_recorder.record_event(
+		if fr:
+			fr.record_event(
 				"arbiter_activation",
-				{"execution_id": self.execution_id},
-				execution_id=self.execution_id
+				{"execution_id": execution_id},
+				execution_id=execution_id
 			)
 		
 		# Get the current instruction
@@ -154,94 +200,78 @@ class ArbiterGraph:
 		# Get the instruction binding
 		binding = self.instruction_bindings.get(current_instruction)
 		if not binding:
-			self.logger.error(f"Instruction binding not found: {current_instruction}")
+			self.logger.error("Instruction binding not found: %s", current_instruction)
 			self._validate_state_if_debug(state)
 			return state
 		
-		# Evaluate policies
-		rule_results = self.policy_engine.evaluate_rules(
-			binding.instruction_type.value,
-			state.to_dict(),
-			{"execution_id": self.execution_id}
+		# Evaluate policies once; the decision and action reuse the summary flags
+		rule_results, violation_flags = self.policy_engine.evaluate(
+			binding.type_name,
+			state.to_dict_view(),
+			{"execution_id": execution_id}
 		)
 		
 		# Record policy evaluation
-		if self.flight_recorder:
-			self.flight_recorder.record_policy_evaluation(
+		if fr:
+			fr.record_policy_evaluation(
 				current_instruction,
 				rule_results,
-				self.execution_id
+				execution_id
 			)
 		
 		# Check if execution should be allowed
-		allowed, evaluation_results = self.policy_engine.should_allow_execution(
-			binding.instruction_type.value,
-			state.to_dict(),
-			{"execution_id": self.execution_id}
-		)
+		allowed = self.policy_engine.allows(violation_flags)
 		
 		if not allowed:
 			# Policy violation - determine action
-			action = self._determine_violation_action(rule_results)
+			action = self._determine_violation_action(violation_flags)
 			
 			if action == "INTERRUPT":
 				state.trigger_interrupt("Policy violation")
-				if self.flight_recorder:
-					self.flight_recorder.record_interrupt(
+				if fr:
+					fr.record_interrupt(
 						current_instruction,
 						"Policy violation",
-						self.execution_id
+						execution_id
 					)
 			elif action == "FALLBACK":
 				state.trigger_fallback("Policy violation")
-				if self.flight_recorder:
-					self.flight_recorder.record_fallback_triggered(
+				if fr:
+					fr.record_fallback_triggered(
 						current_instruction,
 						"Policy violation",
-						self.execution_id
+						execution_id
 					)
 			else:
 				# Log violation and continue
 				for result in rule_results:
 					if not result.get("passed", True):
 						state.add_policy_violation(result)
-						if self.flight_recorder:
-							self.flight_recorder.record_policy_violation(
+						if fr:
+							fr.record_policy_violation(
 								current_instruction,
 								result,
-								self.execution_id
+								execution_id
 							)
 		
 		# Record arbiter decision
-		if self.flight_recorder:
-			self.flight_recorder.record_arbiter_decision(
+		if fr:
+			fr.record_arbiter_decision(
 				current_instruction,
 				"ALLOW" if allowed else "BLOCK",
 				"Policy evaluation completed",
-				self.execution_id
+				execution_id
 			)
 		
 		self._validate_state_if_debug(state)
 		return state
 	
-	def _determine_violation_action(self, rule_results: List[Dict[str, Any]]) -> str:
+	def _determine_violation_action(self, violation_flags: int) -> str:
 		"""Determine the action to take for policy violations."""
-		# Check for critical violations
-		critical_violations = [
-			r for r in rule_results 
-			if not r.get("passed", True) and r.get("severity") == "critical"
-		]
-		
-		if critical_violations:
+		# Critical violations win outright; otherwise any FALLBACK action does
+		if violation_flags & VIOLATION_CRITICAL:
 			return "INTERRUPT"
-		
-		# Check for fallback triggers
-		fallback_violations = [
-			r for r in rule_results 
-			if not r.get("passed", True) and r.get("action") == "FALLBACK"
-		]
-		
-		if fallback_violations:
+		if violation_flags & VIOLATION_FALLBACK:
 			return "FALLBACK"
 		
 		# Default to logging
@@ -259,21 +289,24 @@ class ArbiterGraph:
 			Updated managed state
 		"""
 		start_time = time.time()
+		iid = binding.id
+		itype = binding.instruction_type
+		fr = self.flight_recorder
 		
 		# Record instruction start
-		if self.flight_recorder:
-			self.flight_recorder.record_instruction_start(
-				binding.id,
-				binding.instruction_type.value,
+		if fr:
+			fr.record_instruction_start(
+				iid,
+				binding.type_name,
 				state.os_metadata.execution_id
 			)
 		
 		try:
 			# Set current instruction
-			state.set_current_instruction(binding.id)
+			state.set_current_instruction(iid)
 			
 			# Execute the instruction
-			result = binding.execute(state.to_dict())
+			result = binding.execute(state.to_dict_view())
 			
 			# Update state with result
 			state.update_user_state(result)
@@ -284,58 +317,58 @@ class ArbiterGraph:
 			
 			# Update resource usage
 			state.update_resource_usage(tokens_used, execution_time)
-			state.update_latency_metric(binding.id, execution_time)
+			state.update_latency_metric(iid, execution_time)
 			
 			# Record successful completion
-			if self.flight_recorder:
-				self.flight_recorder.record_instruction_end(
-					binding.id,
+			if fr:
+				fr.record_instruction_end(
+					iid,
 					True,
 					execution_time,
 					tokens_used
 				)
 			
-			self.logger.info(f"Instruction {binding.id} completed successfully in {execution_time:.2f}s")
+			self.logger.info("Instruction %s completed successfully in %.2fs", iid, execution_time)
 			
 		except Exception as e:
 			# Handle execution error
 			execution_time = time.time() - start_time
 			error_msg = str(e)
+			error_type = type(e).__name__
 			
 			# Add error to state
 			state.add_error({
-				"instruction_id": binding.id,
+				"instruction_id": iid,
 				"error": error_msg,
-				"error_type": type(e).__name__,
+				"error_type": error_type,
 				"execution_time": execution_time
 			})
 			
 			# Record error
-			if self.flight_recorder:
-				self.flight_recorder.record_error(
-					binding.id,
-					error_msg,
-					type(e).__name__,
+			if fr:
+				fr.record_error_lazy(
+					iid,
+					lambda: {"instruction_id": iid, "error": error_msg, "error_type": error_type},
 					state.os_metadata.execution_id
 				)
-				self.flight_recorder.record_instruction_end(
-					binding.id,
+				fr.record_instruction_end(
+					iid,
 					False,
 					execution_time,
 					error=error_msg
 				)
 			
-			self.logger.error(f"Instruction {binding.id} failed: {error_msg}")
+			self.logger.error("Instruction %s failed: %s", iid, error_msg)
 			
 			# Check if we should trigger fallback
-			if binding.instruction_type in [InstructionType.TOOL_CALL, InstructionType.GENERATE]:
+			if itype in _FALLBACK_ELIGIBLE:
 				# Try to find a FALLBACK instruction
 				fallback_binding = self._find_fallback_instruction()
 				if fallback_binding:
-					state.trigger_fallback(f"Error in {binding.id}: {error_msg}")
-					if self.flight_recorder:
-						self.flight_recorder.record_fallback_triggered(
-							binding.id,
+					state.trigger_fallback(f"Error in {iid}: {error_msg}")
+					if fr:
+						fr.record_fallback_triggered(
+							iid,
 							f"Error: {error_msg}",
 							state.os_metadata.execution_id
 						)
@@ -345,9 +378,9 @@ class ArbiterGraph:
 	
 	def _find_fallback_instruction(self) -> Optional[InstructionBinding]:
 		"""Find a FALLBACK instruction binding."""
-		for binding in self.instruction_bindings.values():
-			if binding.instruction_type == InstructionType.FALLBACK:
-				return binding
+		fallbacks = self._bindings_by_type.get(InstructionType.FALLBACK)
+		if fallbacks:
+			return next(iter(fallbacks.values()))
 		return None
 	
 	def execute(
@@ -365,6 +398,53 @@ class ArbiterGraph:
 		Returns:
 			Final managed state
 		"""
+		managed_state = self._start_execution(initial_state)
+		
+		# Compile and execute the graph
+		compiled_graph = self.compile()
+		
+		try:
+			# Execute the graph
+			result = compiled_graph.invoke(
+				managed_state,
+				config=config or {}
+			)
+			return self._finish_execution(result)
+			
+		except Exception as e:
+			self._record_execution_error(e)
+			raise
+	
+	async def execute_async(
+		self, 
+		initial_state: Optional[Dict[str, Any]] = None,
+		config: Optional[Dict[str, Any]] = None
+	) -> ManagedState:
+		"""
+		Execute the governed graph without blocking the event loop.
+		
+		Same as execute(), but runs through LangGraph's async path, which
+		executes the (synchronous) instruction nodes off the event loop.
+		"""
+		managed_state = self._start_execution(initial_state)
+		
+		# Compile and execute the graph
+		compiled_graph = self.compile()
+		
+		try:
+			# Execute the graph
+			result = await compiled_graph.ainvoke(
+				managed_state,
+				config=config or {}
+			)
+			return self._finish_execution(result)
+			
+		except Exception as e:
+			self._record_execution_error(e)
+			raise
+	
+	def _start_execution(self, initial_state: Optional[Dict[str, Any]]) -> ManagedState:
+		"""Create the initial managed state and record the execution start."""
 		# Create initial managed state
 		if initial_state is None:
 			initial_state = {}
@@ -383,45 +463,44 @@ class ArbiterGraph:
 				execution_id=self.execution_id
 			)
 		
-		# Compile and execute the graph
-		compiled_graph = self.compile()
-		
-		try:
-			# Execute the graph
-			result = compiled_graph.invoke(
-				managed_state,
-				config=config or {}
-			)
-			
-			# Ensure result is a ManagedState object
-			if isinstance(result, dict):
-				result = ManagedState.from_dict(result)
-			
-			# Record execution completion
-			if self.flight_recorder:
-				self.flight_recorder.record_event(
-					"execution_complete",
-					{
-						"execution_id": self.execution_id,
-						"success": result.is_healthy()
-					},
-					execution_id=self.execution_id
-				)
-			
-			self._validate_state_if_debug(result)
-			return result
-			
-		except Exception as e:
-			# Record execution error
-			if self.flight_recorder:
-				self.flight_recorder.record_error(
-					"execution",
-					str(e),
-					type(e).__name__,
+		return managed_state
+	
+	def _finish_execution(self, result: Any) -> ManagedState:
+		"""Normalize the graph output and record the execution completion."""
+		# Ensure result is a ManagedState object; the graph's output dict holds
+		# fields of a state it already validated, so skip revalidating them
+		if isinstance(result, dict):
+			result = ManagedState.from_trusted_dict(result)
+		
+		# Record execution completion
+		if self.flight_recorder:
+			for overflow in result.take_history_overflow():
+				self.flight_recorder.record_history_overflow(
+					overflow["field"],
+					overflow["entries"],
 					self.execution_id
 				)
-			
-			raise
+			self.flight_recorder.record_event(
+				"execution_complete",
+				{
+					"execution_id": self.execution_id,
+					"success": result.is_healthy()
+				},
+				execution_id=self.execution_id
+			)
+		
+		self._validate_state_if_debug(result)
+		return result
+	
+	def _record_execution_error(self, error: Exception) -> None:
+		"""Record an error that aborted the execution."""
+		if self.flight_recorder:
+			self.flight_recorder.record_error(
+				"execution",
+				str(error),
+				type(error).__name__,
+				self.execution_id
+			)
 	
 	def get_execution_trace(self, execution_id: Optional[str] = None) -> List[Dict[str, Any]]:
 		"""Get the execution trace for debugging."""
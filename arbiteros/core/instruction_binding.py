@@ -1,8 +1,9 @@
 """Instruction Binding definitions for the Agent Constitution Framework (ACF)."""
 
 from enum import Enum
+from functools import cached_property
 from typing import Any, Dict, Optional, Type, Union
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 
 
 class InstructionType(str, Enum):
@@ -39,10 +40,11 @@ class InstructionBinding(BaseModel):
     Hardware Abstraction Layer (HAL).
     """
     
+    # Bindings are write-once contracts: validated at construction, then frozen
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
-        validate_assignment=True,
-        extra="forbid"
+        extra="forbid",
+        frozen=True
     )
     
     # Core identification
@@ -81,17 +83,32 @@ class InstructionBinding(BaseModel):
         description="Cost tier for model routing (e.g., 'fast', 'standard', 'premium')"
     )
     
+    @cached_property
+    def type_name(self) -> str:
+        """The instruction type's string value, looked up once."""
+        return self.instruction_type.value
+    
+    @cached_property
+    def _input_adapter(self) -> TypeAdapter:
+        """Validator for input_schema, built on first use."""
+        return TypeAdapter(self.input_schema)
+    
+    @cached_property
+    def _output_adapter(self) -> TypeAdapter:
+        """Validator for output_schema, built on first use."""
+        return TypeAdapter(self.output_schema)
+    
     def validate_input(self, data: Dict[str, Any]) -> BaseModel:
         """Validate input data against the input schema."""
         try:
-            return self.input_schema(**data)
+            return self._input_adapter.validate_python(data)
         except Exception as e:
             raise ValueError(f"Input validation failed for {self.id}: {e}") from e
     
     def validate_output(self, data: Dict[str, Any]) -> BaseModel:
         """Validate output data against the output schema."""
         try:
-            return self.output_schema(**data)
+            return self._output_adapter.validate_python(data)
         except Exception as e:
             raise ValueError(f"Output validation failed for {self.id}: {e}") from e
     
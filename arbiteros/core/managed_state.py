@@ -1,25 +1,78 @@
 """Managed State for ArbiterOS - the central source of truth."""
 
-from typing import Any, Dict, List, Optional, Union
-from datetime import datetime
-from pydantic import BaseModel, Field, ConfigDict
+from typing import Any, ClassVar, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+from types import MappingProxyType
+from collections import deque
+from datetime import datetime, timedelta
+from time import monotonic_ns
+from pydantic import (
+    BaseModel, Field, ConfigDict, PrivateAttr, computed_field, field_serializer, field_validator,
+    model_validator,
+)
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# StateMetadata status bits, see StateMetadata.status_flags
+_STATUS_ERROR = 1
+_STATUS_POLICY_VIOLATION = 2
+_STATUS_FALLBACK = 4
+_STATUS_INTERRUPT = 8
+_STATUS_UNHEALTHY = _STATUS_ERROR | _STATUS_FALLBACK | _STATUS_INTERRUPT
+
+# Wall-clock time matching a monotonic reading, for converting last_updated_ns
+_WALL_ANCHOR = datetime.now()
+_MONOTONIC_ANCHOR_NS = monotonic_ns()
+
+
+def _ns_to_datetime(ns: int) -> datetime:
+    return _WALL_ANCHOR + timedelta(microseconds=(ns - _MONOTONIC_ANCHOR_NS) // 1000)
+
+
+def _datetime_to_ns(value: datetime) -> int:
+    return _MONOTONIC_ANCHOR_NS + (value - _WALL_ANCHOR) // timedelta(microseconds=1) * 1000
+
+
+def _json_default(value: Any) -> str:
+    """json.dumps fallback matching pydantic and orjson: ISO 8601 datetimes."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+# History fields bounded to StateMetadata.MAX_HISTORY, with the counter their
+# dropped entries are added to (if any)
+_HISTORY_DROP_COUNTERS: Dict[str, Optional[str]] = {
+    "instruction_history": None,
+    "policy_violations": "dropped_policy_violations",
+    "errors": "dropped_errors",
+}
+
 
 class StateMetadata(BaseModel):
     """Metadata for the managed state."""
     
     model_config = ConfigDict(extra="forbid")
     
+    # Entries kept in instruction_history, policy_violations and errors; older
+    # ones are dropped so long-running executions stay bounded in size.
+    MAX_HISTORY: ClassVar[int] = 1000
+    
     # Execution tracking
     execution_id: str = Field(..., description="Unique execution identifier")
     start_time: datetime = Field(default_factory=datetime.now)
-    last_updated: datetime = Field(default_factory=datetime.now)
+    # Monotonic clock reading of the last update; exported as last_updated
+    last_updated_ns: int = Field(default_factory=monotonic_ns, exclude=True, repr=False)
     
     # Instruction tracking
     current_instruction: Optional[str] = Field(default=None)
-    instruction_history: List[str] = Field(default_factory=list)
-    recent_instructions: List[str] = Field(default_factory=list, max_length=5)
+    instruction_history: Deque[str] = Field(default_factory=lambda: deque(maxlen=StateMetadata.MAX_HISTORY))
+    recent_instructions: Deque[str] = Field(default_factory=lambda: deque(maxlen=5), max_length=5)
     
     # Resource tracking
     total_tokens: int = Field(default=0)
@@ -27,17 +80,141 @@ class StateMetadata(BaseModel):
     retry_count: int = Field(default=0)
     
     # Governance state
-    policy_violations: List[Dict[str, Any]] = Field(default_factory=list)
+    policy_violations: Deque[Dict[str, Any]] = Field(default_factory=lambda: deque(maxlen=StateMetadata.MAX_HISTORY))
+    dropped_policy_violations: int = Field(default=0)
     verification_status: Optional[Dict[str, Any]] = Field(default=None)
     interrupt_reason: Optional[str] = Field(default=None)
     
     # Error tracking
-    errors: List[Dict[str, Any]] = Field(default_factory=list)
+    errors: Deque[Dict[str, Any]] = Field(default_factory=lambda: deque(maxlen=StateMetadata.MAX_HISTORY))
+    dropped_errors: int = Field(default=0)
     fallback_triggered: bool = Field(default=False)
     
     # Performance metrics
     latency_metrics: Dict[str, float] = Field(default_factory=dict)
     cost_metrics: Dict[str, Any] = Field(default_factory=dict)
+    
+    # Bumped by ManagedState.add_instruction_to_history; keys the cached trace
+    history_rev: int = Field(default=0, exclude=True, repr=False)
+    # History entries cut off when a longer history was loaded or assigned,
+    # waiting to be forwarded to a FlightDataRecorder; see
+    # ManagedState.take_history_overflow
+    history_overflow: List[Dict[str, Any]] = Field(default_factory=list, exclude=True, repr=False)
+    
+    @model_validator(mode="before")
+    @classmethod
+    def _accept_last_updated(cls, data: Any) -> Any:
+        if isinstance(data, dict) and "last_updated" in data:
+            data = dict(data)
+            value = data.pop("last_updated")
+            if isinstance(value, str):
+                value = datetime.fromisoformat(value)
+            data["last_updated_ns"] = _datetime_to_ns(value)
+        return data
+    
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def last_updated(self) -> datetime:
+        """Time of the last update, converted from last_updated_ns."""
+        return _ns_to_datetime(self.last_updated_ns)
+    
+    @last_updated.setter
+    def last_updated(self, value: datetime) -> None:
+        self.last_updated_ns = _datetime_to_ns(value)
+    
+    @property
+    def status_flags(self) -> int:
+        """_STATUS_* bits summarizing errors/violations/fallback/interrupt.
+        
+        Derived from the fields on each read, so direct assignments and
+        in-place edits are always reflected; never serialized.
+        """
+        status = 0
+        if self.errors:
+            status |= _STATUS_ERROR
+        if self.policy_violations:
+            status |= _STATUS_POLICY_VIOLATION
+        if self.fallback_triggered:
+            status |= _STATUS_FALLBACK
+        if self.interrupt_reason is not None:
+            status |= _STATUS_INTERRUPT
+        return status
+    
+    @field_validator("recent_instructions", mode="after")
+    @classmethod
+    def _bound_recent(cls, value: Deque[str]) -> Deque[str]:
+        return deque(value, maxlen=5)
+    
+    @model_validator(mode="after")
+    def _bound_histories(self) -> "StateMetadata":
+        for name in _HISTORY_DROP_COUNTERS:
+            self._assign_history(name, getattr(self, name))
+        return self
+    
+    def _assign_history(self, name: str, value: Iterable[Any]) -> None:
+        """Store a history field as a bounded deque, counting what doesn't fit."""
+        entries = list(value)
+        excess = len(entries) - self.MAX_HISTORY
+        if excess > 0:
+            counter = _HISTORY_DROP_COUNTERS[name]
+            if counter is not None:
+                setattr(self, counter, getattr(self, counter) + excess)
+            self.history_overflow.append({"field": name, "entries": entries[:excess]})
+            entries = entries[excess:]
+        setattr(self, name, deque(entries, maxlen=self.MAX_HISTORY))
+    
+    @field_serializer("instruction_history", "recent_instructions", "policy_violations", "errors")
+    def _serialize_deque(self, value: Deque[Any]) -> List[Any]:
+        return list(value)
+
+
+class _MetadataView(Mapping[str, Any]):
+    """Live read-only view of StateMetadata with the keys model_dump() exports."""
+    
+    __slots__ = ("_metadata",)
+    
+    def __init__(self, metadata: StateMetadata) -> None:
+        self._metadata = metadata
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in _METADATA_KEYS:
+            raise KeyError(key)
+        return getattr(self._metadata, key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(_METADATA_KEYS)
+    
+    def __len__(self) -> int:
+        return len(_METADATA_KEYS)
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+# Keys of StateMetadata.model_dump(): non-excluded fields, then computed ones
+_METADATA_KEYS: Dict[str, None] = dict.fromkeys(
+    [name for name, field in StateMetadata.model_fields.items() if not field.exclude]
+    + list(StateMetadata.model_computed_fields)
+)
+
+
+class _DictViewCache:
+    """Holder for ManagedState's to_dict_view(); copies and pickles start empty."""
+    
+    __slots__ = ("sources", "view")
+    
+    def __init__(self) -> None:
+        self.sources: Optional[Tuple[Any, Any, Any]] = None
+        self.view: Optional[Mapping[str, Any]] = None
+    
+    def __copy__(self) -> "_DictViewCache":
+        return _DictViewCache()
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "_DictViewCache":
+        return _DictViewCache()
+    
+    def __reduce__(self) -> Tuple[Any, Tuple[()]]:
+        return _DictViewCache, ()
 
 
 class ManagedState(BaseModel):
@@ -59,6 +236,12 @@ class ManagedState(BaseModel):
     # Additional system state
     system_state: Dict[str, Any] = Field(default_factory=dict)
     
+    # Cached to_dict_view(), valid while the fields it wraps are not reassigned
+    _dict_view: _DictViewCache = PrivateAttr(default_factory=_DictViewCache)
+    
+    # ((history_rev, last_updated_ns), trace) from the last get_execution_trace()
+    _trace_cache: Optional[Tuple[Tuple[int, int], List[Dict[str, Any]]]] = PrivateAttr(default=None)
+    
     def __init__(self, **data):
         """Initialize managed state with proper metadata handling."""
         # Ensure os_metadata is properly initialized
@@ -75,23 +258,27 @@ class ManagedState(BaseModel):
     def update_user_state(self, updates: Dict[str, Any]) -> None:
         """Update the user-accessible state."""
         self.user_state.update(updates)
-        self.os_metadata.last_updated = datetime.now()
+        self.os_metadata.last_updated_ns = monotonic_ns()
     
     def update_os_metadata(self, updates: Dict[str, Any]) -> None:
         """Update the protected OS metadata."""
+        metadata = self.os_metadata
         for key, value in updates.items():
-            if hasattr(self.os_metadata, key):
-                setattr(self.os_metadata, key, value)
-        self.os_metadata.last_updated = datetime.now()
+            # Assignments skip validation, so keep deque fields bounded here
+            if key in _HISTORY_DROP_COUNTERS:
+                metadata._assign_history(key, value)
+            elif key == "recent_instructions":
+                metadata.recent_instructions = StateMetadata._bound_recent(value)
+            elif hasattr(metadata, key):
+                setattr(metadata, key, value)
+        self.os_metadata.last_updated_ns = monotonic_ns()
     
     def add_instruction_to_history(self, instruction_id: str) -> None:
         """Add an instruction to the execution history."""
+        # Both are bounded deques, so the oldest entries fall off automatically
         self.os_metadata.instruction_history.append(instruction_id)
         self.os_metadata.recent_instructions.append(instruction_id)
-        
-        # Keep only the last 5 instructions in recent_instructions
-        if len(self.os_metadata.recent_instructions) > 5:
-            self.os_metadata.recent_instructions.pop(0)
+        self.os_metadata.history_rev += 1
     
     def set_current_instruction(self, instruction_id: str) -> None:
         """Set the current instruction being executed."""
@@ -101,44 +288,63 @@ class ManagedState(BaseModel):
     def add_policy_violation(self, violation: Dict[str, Any]) -> None:
         """Add a policy violation to the metadata."""
         violation["timestamp"] = datetime.now().isoformat()
-        self.os_metadata.policy_violations.append(violation)
+        violations = self.os_metadata.policy_violations
+        if len(violations) == violations.maxlen:
+            self.os_metadata.dropped_policy_violations += 1
+        violations.append(violation)
     
     def add_error(self, error: Dict[str, Any]) -> None:
         """Add an error to the metadata."""
         error["timestamp"] = datetime.now().isoformat()
-        self.os_metadata.errors.append(error)
+        errors = self.os_metadata.errors
+        if len(errors) == errors.maxlen:
+            self.os_metadata.dropped_errors += 1
+        errors.append(error)
+    
+    def take_history_overflow(self) -> List[Dict[str, Any]]:
+        """
+        Return and forget the history entries cut off when loading this state.
+        
+        Entries evicted by add_error/add_policy_violation are not included;
+        ArbiterGraph records each of those when it is added.
+        """
+        overflow = self.os_metadata.history_overflow
+        if not overflow:
+            return []
+        self.os_metadata.history_overflow = []
+        return overflow
     
     def set_verification_status(self, status: Dict[str, Any]) -> None:
         """Set the verification status."""
         self.os_metadata.verification_status = status
-        self.os_metadata.last_updated = datetime.now()
+        self.os_metadata.last_updated_ns = monotonic_ns()
     
     def trigger_fallback(self, reason: str) -> None:
         """Trigger a fallback mechanism."""
         self.os_metadata.fallback_triggered = True
         self.os_metadata.interrupt_reason = f"FALLBACK: {reason}"
-        self.os_metadata.last_updated = datetime.now()
+        self.os_metadata.last_updated_ns = monotonic_ns()
     
     def trigger_interrupt(self, reason: str) -> None:
         """Trigger an interrupt."""
         self.os_metadata.interrupt_reason = reason
-        self.os_metadata.last_updated = datetime.now()
+        self.os_metadata.last_updated_ns = monotonic_ns()
     
     def update_resource_usage(self, tokens: int, execution_time: float) -> None:
         """Update resource usage metrics."""
         self.os_metadata.total_tokens += tokens
         self.os_metadata.execution_time += execution_time
-        self.os_metadata.last_updated = datetime.now()
+        self.os_metadata.last_updated_ns = monotonic_ns()
     
     def update_latency_metric(self, operation: str, latency: float) -> None:
         """Update latency metrics for a specific operation."""
         self.os_metadata.latency_metrics[operation] = latency
-        self.os_metadata.last_updated = datetime.now()
+        self.os_metadata.last_updated_ns = monotonic_ns()
     
     def update_cost_metric(self, operation: str, cost: Any) -> None:
         """Update cost metrics for a specific operation."""
         self.os_metadata.cost_metrics[operation] = cost
-        self.os_metadata.last_updated = datetime.now()
+        self.os_metadata.last_updated_ns = monotonic_ns()
     
     def get_state_summary(self) -> Dict[str, Any]:
         """Get a summary of the current state."""
@@ -147,42 +353,45 @@ class ManagedState(BaseModel):
             "current_instruction": self.os_metadata.current_instruction,
             "total_tokens": self.os_metadata.total_tokens,
             "execution_time": self.os_metadata.execution_time,
-            "policy_violations": len(self.os_metadata.policy_violations),
-            "errors": len(self.os_metadata.errors),
+            "policy_violations": len(self.os_metadata.policy_violations) + self.os_metadata.dropped_policy_violations,
+            "errors": len(self.os_metadata.errors) + self.os_metadata.dropped_errors,
             "fallback_triggered": self.os_metadata.fallback_triggered,
             "interrupt_reason": self.os_metadata.interrupt_reason,
             "last_updated": self.os_metadata.last_updated.isoformat()
         }
     
     def get_execution_trace(self) -> List[Dict[str, Any]]:
-        """Get a detailed execution trace."""
+        """
+        Get a detailed execution trace.
+        
+        The list is cached until the history or last_updated changes through
+        this state's methods, so callers should not modify it.
+        """
+        key = (self.os_metadata.history_rev, self.os_metadata.last_updated_ns)
+        cached = self._trace_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
         trace = []
+        timestamp = self.os_metadata.last_updated.isoformat()
         
-        for i, instruction_id in enumerate(self.os_metadata.instruction_history):
+        for step, instruction_id in enumerate(self.os_metadata.instruction_history, 1):
             trace.append({
-                "step": i + 1,
+                "step": step,
                 "instruction_id": instruction_id,
-                "timestamp": self.os_metadata.last_updated.isoformat()
+                "timestamp": timestamp
             })
         
+        self._trace_cache = (key, trace)
         return trace
     
     def is_healthy(self) -> bool:
         """Check if the state is in a healthy condition."""
-        return (
-            len(self.os_metadata.errors) == 0 and
-            not self.os_metadata.fallback_triggered and
-            self.os_metadata.interrupt_reason is None
-        )
+        return not self.os_metadata.status_flags & _STATUS_UNHEALTHY
     
     def requires_attention(self) -> bool:
         """Check if the state requires human attention."""
-        return (
-            len(self.os_metadata.policy_violations) > 0 or
-            len(self.os_metadata.errors) > 0 or
-            self.os_metadata.fallback_triggered or
-            self.os_metadata.interrupt_reason is not None
-        )
+        return self.os_metadata.status_flags != 0
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert the managed state to a dictionary."""
@@ -192,6 +401,33 @@ class ManagedState(BaseModel):
             "system_state": self.system_state
         }
     
+    def to_dict_view(self) -> Mapping[str, Any]:
+        """
+        Return a read-only dictionary view of the managed state.
+        
+        Zero-copy counterpart of to_dict() for hot paths: the view is built
+        once and reflects later updates, and its metadata values are the live
+        fields (deques included), so it is not JSON-serializable as is.
+        """
+        cache = self._dict_view
+        sources = cache.sources
+        if (
+            sources is not None
+            and sources[0] is self.user_state
+            and sources[1] is self.os_metadata
+            and sources[2] is self.system_state
+            and cache.view is not None
+        ):
+            return cache.view
+        view = MappingProxyType({
+            "user_state": self.user_state,
+            "os_metadata": _MetadataView(self.os_metadata),
+            "system_state": self.system_state
+        })
+        cache.sources = (self.user_state, self.os_metadata, self.system_state)
+        cache.view = view
+        return view
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ManagedState":
         """Create a ManagedState from a dictionary."""
@@ -199,11 +435,39 @@ class ManagedState(BaseModel):
             data["os_metadata"] = StateMetadata(**data["os_metadata"])
         return cls(**data)
     
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> "ManagedState":
+        """
+        Create a ManagedState from a dict produced internally, without validation.
+        
+        Only the user and system state skip validation; a plain-dict
+        os_metadata is still validated so its history fields become deques.
+        """
+        data = dict(data)
+        metadata = data.get("os_metadata")
+        if metadata is None:
+            data["os_metadata"] = StateMetadata(execution_id=cls._generate_execution_id())
+        elif not isinstance(metadata, StateMetadata):
+            data["os_metadata"] = StateMetadata.model_validate(metadata)
+        data.setdefault("user_state", {})
+        data.setdefault("system_state", {})
+        return cls.model_construct(**data)
+    
     def serialize(self) -> str:
-        """Serialize the state to JSON."""
-        return json.dumps(self.to_dict(), default=str)
+        """Serialize the state to JSON (via orjson when installed)."""
+        data = self.to_dict()
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+            except TypeError:
+                # e.g. ints wider than 64 bits; json.dumps handles those
+                pass
+        # Same bytes as orjson: compact separators, raw UTF-8, ISO datetimes
+        return json.dumps(data, default=_json_default, separators=(",", ":"), ensure_ascii=False)
     
     @classmethod
     def deserialize(cls, data: str) -> "ManagedState":
         """Deserialize the state from JSON."""
+        if ORJSON_AVAILABLE:
+            return cls.from_dict(orjson.loads(data))
         return cls.from_dict(json.loads(data))
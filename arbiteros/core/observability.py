@@ -1,54 +1,148 @@
 """Observability and tracing for ArbiterOS."""
 
-from typing import Any, Dict, List, Optional, Union
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, DefaultDict, Deque, Dict, Iterable, List, Literal, Optional, Tuple, Union
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, computed_field, model_validator
+from pydantic_core import PydanticSerializationError
+from .managed_state import _json_default
+import importlib.util
 import json
 import logging
+import os
+import queue
+import threading
+import time
+import weakref
 
-# OpenTelemetry imports
 try:
-    from opentelemetry import trace
-    from opentelemetry.exporter.jaeger.thrift import JaegerExporter
-    from opentelemetry.sdk.trace import TracerProvider
-    from opentelemetry.sdk.trace.export import BatchSpanProcessor
-    from opentelemetry.sdk.resources import Resource
-    from opentelemetry.trace import Status, StatusCode
-    from opentelemetry.instrumentation.auto_instrumentation import sitecustomize
-    OTEL_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    OTEL_AVAILABLE = False
-    # Create dummy classes for when OpenTelemetry is not available
-    class trace:
-        class Tracer:
-            def start_span(self, *args, **kwargs):
-                return DummySpan()
-        def get_tracer(self, *args, **kwargs):
-            return self.Tracer()
-    
-    class DummySpan:
-        def __enter__(self):
-            return self
-        def __exit__(self, *args):
-            pass
-        def set_attribute(self, *args, **kwargs):
-            pass
-        def set_status(self, *args, **kwargs):
-            pass
-        def add_event(self, *args, **kwargs):
-            pass
-        def end(self, *args, **kwargs):
-            pass
+    ORJSON_AVAILABLE = False
+
+class DummySpan:
+    """Stand-in span used when OpenTelemetry tracing is off."""
+    __slots__ = ()
+    def __enter__(self):
+        return self
+    def __exit__(self, *args):
+        pass
+    def set_attribute(self, *args, **kwargs):
+        pass
+    def set_status(self, *args, **kwargs):
+        pass
+    def add_event(self, *args, **kwargs):
+        pass
+    def end(self, *args, **kwargs):
+        pass
+
+
+# OpenTelemetry is only imported by _setup_otel, so importing this module
+# (and the CLIs built on it) doesn't pull in the SDK unless tracing is used
+def _otel_installed() -> bool:
+    # find_spec only imports the parent packages, which are namespaces here
+    try:
+        return all(
+            importlib.util.find_spec(name) is not None
+            for name in (
+                "opentelemetry.sdk",
+                "opentelemetry.exporter.otlp.proto.grpc",
+                "opentelemetry.instrumentation",
+            )
+        )
+    except ImportError:
+        return False
+
+
+OTEL_AVAILABLE = _otel_installed()
+
+
+def _datetime_to_ns(value: datetime) -> int:
+    return round(value.timestamp() * 1_000_000) * 1000
 
 
 class TraceEvent(BaseModel):
     """Individual trace event."""
     
     event_type: str = Field(..., description="Type of event")
-    timestamp: datetime = Field(default_factory=datetime.now)
+    # Wall-clock time in nanoseconds; exported as timestamp
+    timestamp_ns: int = Field(default_factory=time.time_ns, exclude=True, repr=False)
     data: Dict[str, Any] = Field(default_factory=dict)
     instruction_id: Optional[str] = Field(default=None)
     execution_id: Optional[str] = Field(default=None)
+    
+    @model_validator(mode="before")
+    @classmethod
+    def _accept_timestamp(cls, data: Any) -> Any:
+        if isinstance(data, dict) and "timestamp" in data:
+            data = dict(data)
+            value = data.pop("timestamp")
+            if isinstance(value, str):
+                value = datetime.fromisoformat(value)
+            data["timestamp_ns"] = _datetime_to_ns(value)
+        return data
+    
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def timestamp(self) -> datetime:
+        """Time of the event, converted from timestamp_ns."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+    
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self.timestamp_ns = _datetime_to_ns(value)
+
+
+# Serializes a whole trace in one pydantic-core call when orjson is missing
+_TRACE_EVENTS_ADAPTER = TypeAdapter(List[TraceEvent])
+
+# Event data, or a callable building it once the event is actually read
+EventData = Union[Dict[str, Any], Callable[[], Dict[str, Any]]]
+
+# Event types whose data get_trace_summary() lists, and the key it uses
+_SUMMARY_CATEGORIES = {
+    "error": "errors",
+    "policy_violation": "policy_violations",
+    "fallback_triggered": "fallbacks",
+    "interrupt": "interrupts",
+}
+
+
+def _new_summary() -> Dict[str, Any]:
+    summary: Dict[str, Any] = {"event_types": {}, "instructions": {}}
+    for key in _SUMMARY_CATEGORIES.values():
+        summary[key] = deque()
+    return summary
+
+
+# Most export_trace results kept by each FlightDataRecorder
+_EXPORT_CACHE_SIZE = 32
+
+# BatchSpanProcessor settings used when neither a FlightDataRecorder argument
+# nor the matching OTEL_BSP_* environment variable gives one
+_SPAN_BATCH_DEFAULTS = {
+    "max_queue_size": ("OTEL_BSP_MAX_QUEUE_SIZE", 4096),
+    "schedule_delay_millis": ("OTEL_BSP_SCHEDULE_DELAY", 1000),
+    "max_export_batch_size": ("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", 256),
+    "export_timeout_millis": ("OTEL_BSP_EXPORT_TIMEOUT", 10000),
+}
+
+
+def _drain_periodically(
+    recorder_ref: "weakref.ReferenceType[FlightDataRecorder]",
+    stop: threading.Event,
+    interval: float
+) -> None:
+    """Background worker: drain a recorder's queued events every interval."""
+    while not stop.wait(interval):
+        recorder = recorder_ref()
+        if recorder is None:
+            return
+        recorder._drain_pending()
+        # Don't keep the recorder alive while waiting
+        del recorder
 
 
 class FlightDataRecorder:
@@ -59,19 +153,101 @@ class FlightDataRecorder:
     enabling time-travel debugging and comprehensive audit trails.
     """
     
-    def __init__(self, enable_otel: bool = True, jaeger_endpoint: Optional[str] = None):
+    def __init__(
+        self,
+        enable_otel: bool = True,
+        jaeger_endpoint: Optional[str] = None,
+        max_events: Optional[int] = 100_000,
+        max_queue_size: Optional[int] = None,
+        schedule_delay_millis: Optional[int] = None,
+        max_export_batch_size: Optional[int] = None,
+        export_timeout_millis: Optional[int] = None,
+        span_processor: Literal["batch", "simple"] = "batch",
+        sampler_ratio: float = 1.0,
+        drain_interval: Optional[float] = None
+    ):
         """
         Initialize the Flight Data Recorder.
         
         Args:
             enable_otel: Whether to enable OpenTelemetry tracing
-            jaeger_endpoint: Jaeger endpoint for distributed tracing
+            jaeger_endpoint: OTLP/gRPC endpoint spans are exported to, e.g.
+                Jaeger's OTLP receiver at "http://localhost:4317"
+            max_events: Number of most recent events kept (None for no limit)
+            max_queue_size: Spans buffered before new ones are dropped
+            schedule_delay_millis: Delay between two span exports
+            max_export_batch_size: Spans sent per export
+            export_timeout_millis: Time allowed for one export
+            span_processor: "batch" to export spans from a background worker,
+                or "simple" to export each span synchronously as it ends
+            sampler_ratio: Fraction of traces sampled, from 0.0 to 1.0
+            drain_interval: Seconds between background passes turning queued
+                events into TraceEvents (default None: only when traces are
+                read, without a worker thread)
+        
+        The span batching arguments fall back to the OTEL_BSP_* environment
+        variables, then to values sized for bursts of policy events.
+        
+        "batch" keeps export off the request path, but its single worker can
+        fall behind and drop spans under heavy concurrent load. "simple"
+        never drops spans but blocks on every export, so pair it with a low
+        sampler_ratio (e.g. 0.01) for high-throughput agents.
         """
+        if span_processor not in ("batch", "simple"):
+            raise ValueError(f"Unsupported span processor: {span_processor}")
+        if not 0.0 <= sampler_ratio <= 1.0:
+            raise ValueError(f"sampler_ratio must be between 0 and 1, got {sampler_ratio}")
         self.enable_otel = enable_otel and OTEL_AVAILABLE
         self.jaeger_endpoint = jaeger_endpoint
-        self.traces: List[TraceEvent] = []
+        self.max_events = max_events
+        self.span_processor = span_processor
+        self.sampler_ratio = sampler_ratio
+        overrides = {
+            "max_queue_size": max_queue_size,
+            "schedule_delay_millis": schedule_delay_millis,
+            "max_export_batch_size": max_export_batch_size,
+            "export_timeout_millis": export_timeout_millis,
+        }
+        self.span_batch_settings: Dict[str, int] = {}
+        for name, (env_var, default) in _SPAN_BATCH_DEFAULTS.items():
+            value = overrides[name]
+            if value is None:
+                value = int(os.environ.get(env_var, default))
+            self.span_batch_settings[name] = value
+        # Ring buffer: once full, each new event overwrites the oldest
+        self._traces: Deque[TraceEvent] = deque(maxlen=max_events)
+        # (event_type, time_ns, data, instruction_id, execution_id) tuples
+        # queued by record_event; TraceEvents are built off the hot path, by
+        # the drain worker or by a reader catching up, and data may still be
+        # a payload factory until then
+        self._pending: "queue.SimpleQueue[Tuple[str, int, EventData, Optional[str], Optional[str]]]" = queue.SimpleQueue()
+        self._drain_lock = threading.Lock()
+        # Events grouped by execution_id / instruction_id, and running summary
+        # counts per execution_id, kept in step with _traces
+        self._by_execution: DefaultDict[Optional[str], Deque[TraceEvent]] = defaultdict(deque)
+        self._by_instruction: DefaultDict[Optional[str], Deque[TraceEvent]] = defaultdict(deque)
+        self._summaries: DefaultDict[Optional[str], Dict[str, Any]] = defaultdict(_new_summary)
+        self._indexed_count = 0
+        self._last_indexed: Optional[TraceEvent] = None
+        # Last export_trace output per (execution_id, format), with the event
+        # count and last event it was rendered from
+        self._export_cache: Dict[Tuple[str, str], Tuple[int, TraceEvent, str]] = {}
         self.logger = logging.getLogger(__name__)
         
+        # Optional drain worker, so queued events can't pile up unbounded when
+        # traces are rarely read; it only holds a weak reference to the recorder
+        self._stop_draining = threading.Event()
+        self._drain_worker: Optional[threading.Thread] = None
+        if drain_interval is not None:
+            self._drain_worker = threading.Thread(
+                target=_drain_periodically,
+                args=(weakref.ref(self), self._stop_draining, drain_interval),
+                name="arbiteros-flight-recorder",
+                daemon=True
+            )
+            self._drain_worker.start()
+            weakref.finalize(self, self._stop_draining.set)
+        
         # Initialize OpenTelemetry if enabled
         if self.enable_otel:
             self._setup_otel()
@@ -81,6 +257,14 @@ class FlightDataRecorder:
     def _setup_otel(self) -> None:
         """Set up OpenTelemetry tracing."""
         try:
+            from opentelemetry import trace
+            from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+            from opentelemetry.sdk.trace import TracerProvider
+            from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
+            from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.instrumentation.auto_instrumentation import sitecustomize  # noqa: F401
+
             # Create resource
             resource = Resource.create({
                 "service.name": "arbiteros-core",
@@ -88,21 +272,28 @@ class FlightDataRecorder:
             })
             
             # Set up tracer provider
-            trace.set_tracer_provider(TracerProvider(resource=resource))
+            trace.set_tracer_provider(TracerProvider(
+                resource=resource,
+                # Like the SDK default, follow the parent span's decision
+                sampler=ParentBased(TraceIdRatioBased(self.sampler_ratio))
+            ))
             tracer = trace.get_tracer(__name__)
             
-            # Set up Jaeger exporter if endpoint provided
+            # Export over OTLP/gRPC if an endpoint is provided
             if self.jaeger_endpoint:
-                jaeger_exporter = JaegerExporter(
-                    agent_host_name="localhost",
-                    agent_port=14268,
-                )
-                span_processor = BatchSpanProcessor(jaeger_exporter)
+                exporter = OTLPSpanExporter(endpoint=self.jaeger_endpoint)
+                if self.span_processor == "simple":
+                    span_processor = SimpleSpanProcessor(exporter)
+                else:
+                    span_processor = BatchSpanProcessor(exporter, **self.span_batch_settings)
                 trace.get_tracer_provider().add_span_processor(span_processor)
             
             self.tracer = tracer
             self.logger.info("OpenTelemetry tracing initialized")
             
+        except ImportError as e:
+            self.logger.warning(f"OpenTelemetry not available, using basic tracing: {e}")
+            self.enable_otel = False
         except Exception as e:
             self.logger.error(f"Failed to initialize OpenTelemetry: {e}")
             self.enable_otel = False
@@ -129,10 +320,41 @@ class FlightDataRecorder:
             # Return a dummy span for basic tracing
             return DummySpan()
     
+    @asynccontextmanager
+    async def async_span(
+        self, 
+        name: str, 
+        execution_id: str, 
+        context: Any = None,
+        **attributes
+    ) -> AsyncIterator[Any]:
+        """
+        Trace an async block as the current span.
+        
+        The span is current only in the calling task's context, so it never
+        leaks into other tasks interleaved at await points, and it ends when
+        the block exits.
+        
+        Args:
+            name: Name of the trace span
+            execution_id: Unique execution identifier
+            context: Explicit parent OpenTelemetry Context (default: current)
+            **attributes: Additional span attributes
+        """
+        if not self.enable_otel:
+            yield DummySpan()
+            return
+        with self.tracer.start_as_current_span(
+            name,
+            context=context,
+            attributes={"execution_id": execution_id, **attributes}
+        ) as span:
+            yield span
+    
     def record_event(
         self, 
         event_type: str, 
-        data: Dict[str, Any], 
+        data: EventData, 
         instruction_id: Optional[str] = None,
         execution_id: Optional[str] = None
     ) -> None:
@@ -141,21 +363,148 @@ class FlightDataRecorder:
         
         Args:
             event_type: Type of event (e.g., "instruction_start", "policy_violation")
-            data: Event data
+            data: Event data, or a callable returning it when the event is read
             instruction_id: Associated instruction ID
             execution_id: Associated execution ID
         """
-        event = TraceEvent(
-            event_type=event_type,
-            data=data,
-            instruction_id=instruction_id,
-            execution_id=execution_id
-        )
+        # Log the event (built and formatted only if INFO is enabled)
+        if self.logger.isEnabledFor(logging.INFO):
+            if callable(data):
+                data = data()
+            self.logger.info("Trace event: %s - %s", event_type, data)
         
-        self.traces.append(event)
+        # Snapshot the payload, so later edits by the caller can't rewrite it
+        if isinstance(data, dict):
+            data = dict(data)
         
-        # Log the event
-        self.logger.info(f"Trace event: {event_type} - {data}")
+        # Keep the hot path to a queue put; see _drain_pending
+        self._pending.put((event_type, time.time_ns(), data, instruction_id, execution_id))
+        # Unread traces never hold more than max_events, so neither does the queue
+        if self.max_events is not None and self._pending.qsize() > self.max_events:
+            self._drain_pending()
+    
+    @property
+    def traces(self) -> Tuple[TraceEvent, ...]:
+        """
+        Snapshot of all recorded trace events, in recording order.
+        
+        An immutable tuple rather than the live buffer, so edits fail loudly
+        instead of being lost: record events with record_event(), replace
+        them by assigning to traces, and empty them with clear_traces().
+        """
+        self._drain_pending()
+        with self._drain_lock:
+            return tuple(self._traces)
+    
+    @traces.setter
+    def traces(self, events: Iterable[TraceEvent]) -> None:
+        self._drain_pending()
+        with self._drain_lock:
+            self._traces = deque(events, maxlen=self.max_events)
+            self._rebuild_indexes()
+    
+    def _index_event(self, event: TraceEvent) -> None:
+        """Add an event to the lookup indexes and its execution's summary."""
+        self._by_execution[event.execution_id].append(event)
+        self._by_instruction[event.instruction_id].append(event)
+        summary = self._summaries[event.execution_id]
+        event_types = summary["event_types"]
+        event_types[event.event_type] = event_types.get(event.event_type, 0) + 1
+        if event.instruction_id:
+            instructions = summary["instructions"]
+            instructions[event.instruction_id] = instructions.get(event.instruction_id, 0) + 1
+        category = _SUMMARY_CATEGORIES.get(event.event_type)
+        if category is not None:
+            summary[category].append(event.data)
+        self._indexed_count += 1
+        self._last_indexed = event
+    
+    def _unindex_oldest(self, event: TraceEvent) -> None:
+        """Drop the oldest indexed event, as it is evicted from the ring buffer."""
+        by_execution = self._by_execution[event.execution_id]
+        by_execution.popleft()
+        if not by_execution:
+            del self._by_execution[event.execution_id]
+            del self._summaries[event.execution_id]
+        else:
+            summary = self._summaries[event.execution_id]
+            event_types = summary["event_types"]
+            event_types[event.event_type] -= 1
+            if not event_types[event.event_type]:
+                del event_types[event.event_type]
+            if event.instruction_id:
+                instructions = summary["instructions"]
+                instructions[event.instruction_id] -= 1
+                if not instructions[event.instruction_id]:
+                    del instructions[event.instruction_id]
+            category = _SUMMARY_CATEGORIES.get(event.event_type)
+            if category is not None:
+                summary[category].popleft()
+        by_instruction = self._by_instruction[event.instruction_id]
+        by_instruction.popleft()
+        if not by_instruction:
+            del self._by_instruction[event.instruction_id]
+        self._indexed_count -= 1
+    
+    def _in_sync(self) -> bool:
+        """Whether the indexes still describe exactly the events in _traces."""
+        if self._indexed_count != len(self._traces):
+            return False
+        return not self._traces or self._traces[-1] is self._last_indexed
+    
+    def _rebuild_indexes(self) -> None:
+        """Reindex _traces from scratch, e.g. after it was replaced or edited."""
+        # Exports rendered from the old events no longer apply
+        self._export_cache.clear()
+        self._by_execution.clear()
+        self._by_instruction.clear()
+        self._summaries.clear()
+        self._indexed_count = 0
+        self._last_indexed = None
+        for event in self._traces:
+            self._index_event(event)
+    
+    def _indexed(self) -> None:
+        """Drain queued events and make sure the indexes match _traces."""
+        self._drain_pending()
+        if not self._in_sync():
+            with self._drain_lock:
+                self._rebuild_indexes()
+    
+    def close(self) -> None:
+        """Stop the drain worker and process any queued events."""
+        self._stop_draining.set()
+        if self._drain_worker is not None:
+            self._drain_worker.join()
+        self._drain_pending()
+    
+    def _drain_pending(self) -> None:
+        """Turn queued raw events into TraceEvents."""
+        if self._pending.empty():
+            return
+        with self._drain_lock:
+            # Only what was queued on entry, so producers that keep recording
+            # can't hold the lock (and starve readers) indefinitely
+            for _ in range(self._pending.qsize()):
+                try:
+                    event_type, time_ns, data, instruction_id, execution_id = self._pending.get_nowait()
+                except queue.Empty:
+                    break
+                # Fields come from record_event, so skip re-validating them
+                event = TraceEvent.model_construct(
+                    event_type=event_type,
+                    timestamp_ns=time_ns,
+                    data=data() if callable(data) else data,
+                    instruction_id=instruction_id,
+                    execution_id=execution_id
+                )
+                # Once out of step, the indexes wait for _indexed() to rebuild
+                traces = self._traces
+                if self._in_sync():
+                    if traces and len(traces) == traces.maxlen:
+                        self._unindex_oldest(traces[0])
+                    self._index_event(event)
+                traces.append(event)
     
     def record_instruction_start(
         self, 
@@ -293,6 +642,37 @@ class FlightDataRecorder:
             execution_id=execution_id
         )
     
+    def record_history_overflow(
+        self,
+        field: str,
+        entries: List[Any],
+        execution_id: str
+    ) -> None:
+        """Record history entries a ManagedState dropped to stay bounded."""
+        self.record_event(
+            "history_overflow",
+            {
+                "field": field,
+                "dropped": len(entries),
+                "entries": entries
+            },
+            execution_id=execution_id
+        )
+    
+    def record_error_lazy(
+        self, 
+        instruction_id: str, 
+        payload: Callable[[], Dict[str, Any]],
+        execution_id: str
+    ) -> None:
+        """Record an error whose data is built by payload only when read."""
+        self.record_event(
+            "error",
+            payload,
+            instruction_id=instruction_id,
+            execution_id=execution_id
+        )
+    
     def record_fallback_triggered(
         self, 
         instruction_id: str, 
@@ -329,54 +709,35 @@ class FlightDataRecorder:
     
     def get_execution_trace(self, execution_id: str) -> List[TraceEvent]:
         """Get the complete execution trace for a specific execution."""
-        return [
-            event for event in self.traces 
-            if event.execution_id == execution_id
-        ]
+        self._indexed()
+        with self._drain_lock:
+            events = self._by_execution.get(execution_id)
+            return list(events) if events else []
     
     def get_instruction_trace(self, instruction_id: str) -> List[TraceEvent]:
         """Get the trace for a specific instruction."""
-        return [
-            event for event in self.traces 
-            if event.instruction_id == instruction_id
-        ]
+        self._indexed()
+        with self._drain_lock:
+            events = self._by_instruction.get(instruction_id)
+            return list(events) if events else []
     
     def get_trace_summary(self, execution_id: str) -> Dict[str, Any]:
         """Get a summary of the execution trace."""
-        events = self.get_execution_trace(execution_id)
-        
-        summary = {
-            "execution_id": execution_id,
-            "total_events": len(events),
-            "event_types": {},
-            "instructions": set(),
-            "errors": [],
-            "policy_violations": [],
-            "fallbacks": [],
-            "interrupts": []
-        }
-        
-        for event in events:
-            # Count event types
-            event_type = event.event_type
-            summary["event_types"][event_type] = summary["event_types"].get(event_type, 0) + 1
+        self._indexed()
+        # Copy under the lock so a concurrent drain can't change them mid-read
+        with self._drain_lock:
+            events = self._by_execution.get(execution_id, ())
+            counts = self._summaries.get(execution_id) or _new_summary()
             
-            # Track instructions
-            if event.instruction_id:
-                summary["instructions"].add(event.instruction_id)
-            
-            # Categorize events
-            if event_type == "error":
-                summary["errors"].append(event.data)
-            elif event_type == "policy_violation":
-                summary["policy_violations"].append(event.data)
-            elif event_type == "fallback_triggered":
-                summary["fallbacks"].append(event.data)
-            elif event_type == "interrupt":
-                summary["interrupts"].append(event.data)
-        
-        # Convert set to list for JSON serialization
-        summary["instructions"] = list(summary["instructions"])
+            summary = {
+                "execution_id": execution_id,
+                "total_events": len(events),
+                "event_types": dict(counts["event_types"]),
+                # A list rather than a set, for JSON serialization
+                "instructions": list(counts["instructions"])
+            }
+            for key in _SUMMARY_CATEGORIES.values():
+                summary[key] = list(counts[key])
         
         return summary
     
@@ -392,9 +753,53 @@ class FlightDataRecorder:
             Exported trace data
         """
         events = self.get_execution_trace(execution_id)
+        if not events:
+            return self._render_trace(events, format)
         
+        # Events are only ever appended (or evicted by an append), so an
+        # unchanged count and last event mean an unchanged trace
+        key = (execution_id, format)
+        cached = self._export_cache.get(key)
+        if cached is not None and cached[0] == len(events) and cached[1] is events[-1]:
+            return cached[2]
+        
+        exported = self._render_trace(events, format)
+        if len(self._export_cache) >= _EXPORT_CACHE_SIZE and key not in self._export_cache:
+            del self._export_cache[next(iter(self._export_cache))]
+        self._export_cache[key] = (len(events), events[-1], exported)
+        return exported
+    
+    def _render_trace(self, events: List[TraceEvent], format: str) -> str:
+        """Serialize events in the given export format."""
         if format == "json":
-            return json.dumps([event.model_dump() for event in events], default=str, indent=2)
+            if not ORJSON_AVAILABLE:
+                try:
+                    return _TRACE_EVENTS_ADAPTER.dump_json(events, indent=2, warnings=False).decode()
+                except PydanticSerializationError:
+                    # Event data pydantic can't encode; fall back to str()
+                    pass
+            # Plain per-event dicts in TraceEvent's own JSON layout (fields in
+            # model order, timestamp last as ISO 8601), so every encoder
+            # produces the same document
+            data = [
+                {
+                    "event_type": event.event_type,
+                    "data": event.data,
+                    "instruction_id": event.instruction_id,
+                    "execution_id": event.execution_id,
+                    "timestamp": event.timestamp.isoformat()
+                }
+                for event in events
+            ]
+            if ORJSON_AVAILABLE:
+                try:
+                    return orjson.dumps(
+                        data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    ).decode()
+                except TypeError:
+                    # e.g. ints wider than 64 bits; json.dumps handles those
+                    pass
+            return json.dumps(data, default=_json_default, indent=2, ensure_ascii=False)
         elif format == "text":
             lines = []
             for event in events:
@@ -404,6 +809,13 @@ class FlightDataRecorder:
             raise ValueError(f"Unsupported format: {format}")
     
     def clear_traces(self) -> None:
-        """Clear all stored traces."""
-        self.traces.clear()
+        """Clear all stored traces, including events still queued."""
+        with self._drain_lock:
+            for _ in range(self._pending.qsize()):
+                try:
+                    self._pending.get_nowait()
+                except queue.Empty:
+                    break
+            self._traces.clear()
+            self._rebuild_indexes()
         self.logger.info("All traces cleared")
@@ -1,9 +1,17 @@
 """Policy Engine for declarative governance enforcement."""
 
-from typing import Any, Dict, List, Optional, Union, Callable
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple, Union, Callable
 from enum import Enum
+from types import MappingProxyType
 from pydantic import BaseModel, Field, ConfigDict, validator
 import json
+import threading
+
+try:
+	import hyperscan
+	HYPERSCAN_AVAILABLE = True
+except ImportError:
+	HYPERSCAN_AVAILABLE = False
 
 
 class PolicyRuleType(str, Enum):
@@ -28,7 +36,8 @@ class PolicyRuleType(str, Enum):
 class PolicyRule(BaseModel):
 	"""Individual policy rule definition."""
 	
-	model_config = ConfigDict(extra="forbid")
+	# Frozen: PolicyEngine compiles rules into evaluators once, up front
+	model_config = ConfigDict(extra="forbid", frozen=True)
 	
 	rule_id: str = Field(..., description="Unique identifier for this rule")
 	rule_type: PolicyRuleType = Field(..., description="Type of policy rule")
@@ -103,6 +112,64 @@ class PolicyConfig(BaseModel):
 		return None
 
 
+# RuleEvaluation.flags bits, set while rules are evaluated
+VIOLATION_ANY = 1
+VIOLATION_CRITICAL = 2
+VIOLATION_FALLBACK = 4
+
+
+def _compile_keyword_scanner(keywords: Tuple[str, ...]) -> Optional[Callable[[str], Optional[int]]]:
+	"""
+	Compile keywords into one case-insensitive Hyperscan database.
+	
+	The returned function gives the index of the first listed keyword found
+	in a text, or None. Returns None itself when Hyperscan is unavailable or
+	a keyword is empty or non-ASCII (Hyperscan only folds ASCII case).
+	"""
+	if not HYPERSCAN_AVAILABLE or not keywords:
+		return None
+	if not all(k and k.isascii() for k in keywords):
+		return None
+	database = hyperscan.Database()
+	database.compile(
+		expressions=[k.encode() for k in keywords],
+		ids=list(range(len(keywords))),
+		elements=len(keywords),
+		flags=hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH,
+		literal=True
+	)
+	# Scratch space can't be shared by concurrent scans
+	local = threading.local()
+	
+	def first_match(text: str) -> Optional[int]:
+		scratch = getattr(local, "scratch", None)
+		if scratch is None:
+			scratch = local.scratch = hyperscan.Scratch(database)
+		found: List[int] = []
+		database.scan(
+			text.encode("utf-8", "surrogatepass"),
+			match_event_handler=lambda id_, start, end, flags, context: found.append(id_),
+			scratch=scratch
+		)
+		return min(found) if found else None
+	
+	return first_match
+
+
+# Shared read-only default for states without os_metadata
+_NO_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+# Compiled rule: (instruction_type, state, context) -> (result, VIOLATION_* bits)
+RuleRunner = Callable[[str, Dict[str, Any], Optional[Dict[str, Any]]], Tuple[Dict[str, Any], int]]
+
+
+class RuleEvaluation(NamedTuple):
+	"""Rule results plus VIOLATION_* flags summarizing the failures."""
+	
+	results: List[Dict[str, Any]]
+	flags: int
+
+
 class PolicyEngine:
 	"""Centralized policy engine for governance enforcement."""
 	
@@ -114,6 +181,10 @@ class PolicyEngine:
 		# Precompiled caches for fast lookup per v8.3 guidance
 		self._applies_map: Dict[str, List[PolicyRule]] = {}
 		self._transition_matrix: Dict[str, bool] = {}
+		# Compiled rule runners per instruction type, in rule order with the
+		# '*' rules included; types with no rules of their own use the default
+		self._compiled: Dict[str, Tuple[RuleRunner, ...]] = {}
+		self._compiled_default: Tuple[RuleRunner, ...] = ()
 		self._compile_rule_caches()
 	
 	def _register_default_evaluators(self) -> None:
@@ -150,6 +221,205 @@ class PolicyEngine:
 				for flow in allowed:
 					transition[flow] = True
 		self._transition_matrix = transition
+		# Resolve each instruction type's full rule list and evaluators once;
+		# compiled semantic safety rules read the transition matrix above
+		global_rules = applies.get("*", [])
+		self._compiled = {
+			itype: self._compile_rules(rules + global_rules)
+			for itype, rules in applies.items()
+			if itype != "*"
+		}
+		self._compiled_default = self._compile_rules(global_rules)
+	
+	def _compile_rules(self, rules: List[PolicyRule]) -> Tuple[RuleRunner, ...]:
+		"""Compile each rule into a runner, in order."""
+		return tuple(self._compile_rule(rule) for rule in rules)
+	
+	def _compile_rule(self, rule: PolicyRule) -> RuleRunner:
+		"""
+		Fold a rule and its evaluator into one runner.
+		
+		The runner builds the same result dict as _apply_evaluator, and
+		returns the VIOLATION_* bits for it, fixed per rule, alongside.
+		"""
+		evaluator = self._resolve_evaluator(rule)
+		rule_id = rule.rule_id
+		rule_type = rule.rule_type
+		severity = rule.severity
+		action = rule.action
+		action_params = rule.action_params
+		failed_flags = VIOLATION_ANY
+		if severity == "critical":
+			failed_flags |= VIOLATION_CRITICAL
+		if action == "FALLBACK":
+			failed_flags |= VIOLATION_FALLBACK
+		
+		if evaluator is None:
+			def run_missing(
+				instruction_type: str,
+				state: Dict[str, Any],
+				context: Optional[Dict[str, Any]]
+			) -> Tuple[Dict[str, Any], int]:
+				return {
+					"rule_id": rule_id,
+					"passed": False,
+					"error": f"No evaluator for rule type: {rule_type}",
+					"severity": "error"
+				}, VIOLATION_ANY
+			
+			return run_missing
+		
+		def run(
+			instruction_type: str,
+			state: Dict[str, Any],
+			context: Optional[Dict[str, Any]]
+		) -> Tuple[Dict[str, Any], int]:
+			try:
+				passed, details = evaluator(rule, instruction_type, state, context)
+			except Exception as e:
+				return {
+					"rule_id": rule_id,
+					"passed": False,
+					"error": str(e),
+					"severity": "error"
+				}, VIOLATION_ANY
+			if passed:
+				return {
+					"rule_id": rule_id,
+					"rule_type": rule_type,
+					"passed": passed,
+					"details": details,
+					"severity": severity,
+					"action": None,
+					"action_params": None
+				}, 0
+			return {
+				"rule_id": rule_id,
+				"rule_type": rule_type,
+				"passed": passed,
+				"details": details,
+				"severity": severity,
+				"action": action,
+				"action_params": action_params
+			}, failed_flags
+		
+		return run
+	
+	def _resolve_evaluator(self, rule: PolicyRule) -> Optional[Callable]:
+		"""Pick a rule's evaluator, specializing built-in ones on the rule's condition."""
+		evaluator = self._rule_evaluators.get(rule.rule_type)
+		if evaluator == self._evaluate_resource_limit:
+			return self._compile_resource_limit(rule)
+		if evaluator == self._evaluate_content_aware:
+			return self._compile_content_aware(rule)
+		if evaluator == self._evaluate_semantic_safety:
+			return self._compile_semantic_safety()
+		return evaluator
+	
+	def _compile_semantic_safety(self) -> Callable:
+		"""Build a semantic safety evaluator with the GENERATE->TOOL_CALL flow resolved."""
+		flow_allowed = self._transition_matrix.get("GENERATE->TOOL_CALL", False)
+		
+		def evaluate(
+			rule: PolicyRule,
+			instruction_type: str,
+			state: Dict[str, Any],
+			context: Optional[Dict[str, Any]]
+		) -> tuple[bool, Dict[str, Any]]:
+			if instruction_type == "TOOL_CALL" and not flow_allowed:
+				recent = state.get("os_metadata", _NO_METADATA).get("recent_instructions")
+				if recent and recent[-1] == "GENERATE":
+					return False, {
+						"violation": "Cognitive instruction followed by Execution without verification",
+						"required_action": "Add VERIFY step between GENERATE and TOOL_CALL"
+					}
+			return True, {"message": "Semantic safety check passed"}
+		
+		return evaluate
+	
+	def _compile_content_aware(self, rule: PolicyRule) -> Callable:
+		"""Build a content-aware evaluator with the rule's keywords lowercased once."""
+		check_keywords = "sensitive_keywords" in rule.condition
+		# (keyword, lowercased keyword) pairs, reported in their original form
+		keywords = tuple((k, k.lower()) for k in rule.condition.get("sensitive_keywords") or ())
+		scanner = _compile_keyword_scanner(tuple(k for k, _ in keywords))
+		check_length = "max_length" in rule.condition
+		max_length = rule.condition.get("max_length")
+		
+		def evaluate(
+			rule: PolicyRule,
+			instruction_type: str,
+			state: Dict[str, Any],
+			context: Optional[Dict[str, Any]]
+		) -> tuple[bool, Dict[str, Any]]:
+			content = str(state.get("content", ""))
+			if scanner is not None:
+				index = scanner(content)
+				if index is not None:
+					keyword = keywords[index][0]
+					return False, {
+						"violation": f"Sensitive keyword detected: {keyword}",
+						"detected_keyword": keyword
+					}
+			elif check_keywords:
+				content_lower = content.lower()
+				for keyword, keyword_lower in keywords:
+					if keyword_lower in content_lower:
+						return False, {
+							"violation": f"Sensitive keyword detected: {keyword}",
+							"detected_keyword": keyword
+						}
+			if check_length and len(content) > max_length:
+				return False, {
+					"violation": f"Content exceeds maximum length: {len(content)} > {max_length}",
+					"current_length": len(content),
+					"max_length": max_length
+				}
+			return True, {"message": "Content-aware check passed"}
+		
+		return evaluate
+	
+	def _compile_resource_limit(self, rule: PolicyRule) -> Callable:
+		"""Build a resource limit evaluator with the rule's thresholds read once."""
+		max_tokens = rule.condition.get("max_tokens")
+		max_time = rule.condition.get("max_execution_time")
+		check_tokens = "max_tokens" in rule.condition
+		check_time = "max_execution_time" in rule.condition
+		
+		def evaluate(
+			rule: PolicyRule,
+			instruction_type: str,
+			state: Dict[str, Any],
+			context: Optional[Dict[str, Any]]
+		) -> tuple[bool, Dict[str, Any]]:
+			# Top-level values win; os_metadata is looked up at most once
+			metadata = None
+			if check_tokens:
+				current_tokens = state.get("total_tokens", 0)
+				if not current_tokens:
+					metadata = state.get("os_metadata", _NO_METADATA)
+					current_tokens = metadata.get("total_tokens", 0)
+				if current_tokens > max_tokens:
+					return False, {
+						"violation": f"Token limit exceeded: {current_tokens} > {max_tokens}",
+						"current_tokens": current_tokens,
+						"max_tokens": max_tokens
+					}
+			if check_time:
+				execution_time = state.get("execution_time", 0)
+				if not execution_time:
+					if metadata is None:
+						metadata = state.get("os_metadata", _NO_METADATA)
+					execution_time = metadata.get("execution_time", 0)
+				if execution_time > max_time:
+					return False, {
+						"violation": f"Execution time exceeded: {execution_time}s > {max_time}s",
+						"current_time": execution_time,
+						"max_time": max_time
+					}
+			return True, {"message": "Resource limit check passed"}
+		
+		return evaluate
 	
 	def evaluate_rules(
 		self, 
@@ -168,24 +438,24 @@ class PolicyEngine:
 		Returns:
 			List of rule evaluation results
 		"""
+		return self.evaluate(instruction_type, state, context).results
+	
+	def evaluate(
+		self, 
+		instruction_type: str, 
+		state: Dict[str, Any], 
+		context: Optional[Dict[str, Any]] = None
+	) -> RuleEvaluation:
+		"""Evaluate all applicable rules, also summarizing failures as flags."""
 		results = []
-		# Pull rules for that instruction fast-path, plus global '*'
-		applicable_rules = list(self._applies_map.get(instruction_type, [])) + list(self._applies_map.get("*", []))
-		
-		for rule in applicable_rules:
-			try:
-				result = self._evaluate_rule(rule, instruction_type, state, context)
-				results.append(result)
-			except Exception as e:
-				# Log error but don't fail the entire evaluation
-				results.append({
-					"rule_id": rule.rule_id,
-					"passed": False,
-					"error": str(e),
-					"severity": "error"
-				})
+		flags = 0
+		for run in self._compiled.get(instruction_type, self._compiled_default):
+			# Runners catch evaluator errors and report them as failed results
+			result, failed = run(instruction_type, state, context)
+			results.append(result)
+			flags |= failed
 		
-		return results
+		return RuleEvaluation(results, flags)
 	
 	def _evaluate_rule(
 		self, 
@@ -196,6 +466,17 @@ class PolicyEngine:
 	) -> Dict[str, Any]:
 		"""Evaluate a single rule."""
 		evaluator = self._rule_evaluators.get(rule.rule_type)
+		return self._apply_evaluator(rule, evaluator, instruction_type, state, context)
+	
+	def _apply_evaluator(
+		self, 
+		rule: PolicyRule, 
+		evaluator: Optional[Callable], 
+		instruction_type: str, 
+		state: Dict[str, Any], 
+		context: Optional[Dict[str, Any]]
+	) -> Dict[str, Any]:
+		"""Run an already-resolved evaluator for a rule."""
 		if not evaluator:
 			return {
 				"rule_id": rule.rule_id,
@@ -206,14 +487,18 @@ class PolicyEngine:
 		
 		try:
 			passed, details = evaluator(rule, instruction_type, state, context)
+			if passed:
+				action = action_params = None
+			else:
+				action, action_params = rule.action, rule.action_params
 			return {
 				"rule_id": rule.rule_id,
 				"rule_type": rule.rule_type,
 				"passed": passed,
 				"details": details,
 				"severity": rule.severity,
-				"action": rule.action if not passed else None,
-				"action_params": rule.action_params if not passed else None
+				"action": action,
+				"action_params": action_params
 			}
 		except Exception as e:
 			return {
@@ -355,29 +640,54 @@ class PolicyEngine:
 		self, 
 		instruction_type: str, 
 		state: Dict[str, Any], 
-		context: Optional[Dict[str, Any]] = None
+		context: Optional[Dict[str, Any]] = None,
+		short_circuit: bool = False
 	) -> tuple[bool, List[Dict[str, Any]]]:
 		"""
 		Determine if an instruction should be allowed to execute.
 		
+		Args:
+			short_circuit: Stop at the first blocking failure, returning only
+				the results evaluated up to and including it
+		
 		Returns:
 			Tuple of (allowed, evaluation_results)
 		"""
-		results = self.evaluate_rules(instruction_type, state, context)
-		
-		# Check for critical failures
-		critical_failures = [
-			r for r in results 
-			if not r.get("passed", True) and r.get("severity") == "critical"
-		]
+		if not short_circuit:
+			results = self.evaluate_rules(instruction_type, state, context)
+			return self.decide(results), results
 		
-		if critical_failures:
-			return False, results
-		
-		# In strict mode, any failure blocks execution
-		if self.config.strict_mode:
-			failures = [r for r in results if not r.get("passed", True)]
-			if failures:
+		strict = self.config.strict_mode
+		results = []
+		for r in self._iter_rule_results(instruction_type, state, context):
+			results.append(r)
+			if not r.get("passed", True) and (strict or r.get("severity") == "critical"):
 				return False, results
-		
 		return True, results
+	
+	def _iter_rule_results(
+		self, 
+		instruction_type: str, 
+		state: Dict[str, Any], 
+		context: Optional[Dict[str, Any]]
+	) -> Iterator[Dict[str, Any]]:
+		"""Evaluate applicable rules one at a time, in evaluate() order."""
+		for run in self._compiled.get(instruction_type, self._compiled_default):
+			yield run(instruction_type, state, context)[0]
+	
+	def decide(self, rule_results: List[Dict[str, Any]]) -> bool:
+		"""
+		Decide whether execution is allowed given already-evaluated rules.
+		
+		Critical failures always block; in strict mode any failure blocks.
+		"""
+		strict = self.config.strict_mode
+		for r in rule_results:
+			if not r.get("passed", True) and (strict or r.get("severity") == "critical"):
+				return False
+		return True
+	
+	def allows(self, flags: int) -> bool:
+		"""Same decision as decide(), from RuleEvaluation.flags."""
+		blocking = VIOLATION_ANY if self.config.strict_mode else VIOLATION_CRITICAL
+		return not flags & blocking
@@ -15,9 +15,10 @@ Run examples:
 from __future__ import annotations
 
 import argparse
-import json
+import importlib.util
 import os
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
 import httpx
 from pydantic import BaseModel, Field
@@ -30,12 +31,29 @@ from arbiteros import (
     InstructionBinding,
     InstructionType,
 )
+from arbiteros.examples.utils import pretty_json
 
 
 # ==========================
 # LLM helper (optional)
 # ==========================
 
+# Shared client so repeated calls reuse pooled keep-alive connections instead
+# of paying a TCP/TLS handshake each time; HTTP/2 when h2 is installed.
+_CLIENT: Optional[httpx.Client] = None
+
+
+def _client() -> httpx.Client:
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.Client(
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _CLIENT
+
+
 def _openai_chat(messages: Any, max_tokens: int = 256) -> str:
     """Call OpenAI-compatible endpoint if env is configured, else return a stub.
 
@@ -59,13 +77,12 @@ def _openai_chat(messages: Any, max_tokens: int = 256) -> str:
         "temperature": 0.2,
         "max_tokens": max_tokens,
     }
-    with httpx.Client(timeout=30) as client:
-        r = client.post(url, headers=headers, json=payload)
-        r.raise_for_status()
-        data = r.json()
-        # OpenAI-compatible schema
-        content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-        return content or "Plan: Navigate -> Verify -> RiskGate -> Dispense/Fallback"
+    r = _client().post(url, headers=headers, json=payload)
+    r.raise_for_status()
+    data = r.json()
+    # OpenAI-compatible schema
+    content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
+    return content or "Plan: Navigate -> Verify -> RiskGate -> Dispense/Fallback"
 
 
 # ==========================
@@ -237,7 +254,9 @@ def build_policy() -> PolicyConfig:
     )
 
 
+@lru_cache(maxsize=1)
 def build_graph() -> ArbiterGraph:
+    """Build the governed graph once; every scenario run reuses it."""
     policy = build_policy()
     g = ArbiterGraph(policy_config=policy, enable_observability=True)
 
@@ -367,7 +386,7 @@ def run_scenario(scenario: str) -> None:
     # Summaries and traces
     print("\n=== Hospital Med Delivery Demo ===")
     print(f"Scenario: {scenario}")
-    print(json.dumps(result.get_state_summary(), indent=2))
+    print(pretty_json(result.get_state_summary()))
     instr_hist = result.os_metadata.instruction_history if hasattr(result, "os_metadata") else []
     print("\n-- Audit Log (instruction history) --")
     for i, name in enumerate(instr_hist, 1):
@@ -6,6 +6,7 @@ import asyncio
 import json
 
 from arbiteros import ArbiterGraph, PolicyConfig, PolicyRule, PolicyRuleType, InstructionBinding, InstructionType
+from arbiteros.examples.simple_agent_calc import safe_evaluate
 
 
 # Define schemas for our example
@@ -67,7 +68,8 @@ def tool_call_instruction(state: ToolCallInput) -> Dict[str, Any]:
 	"""Simple tool call instruction."""
 	# Simulate tool execution
 	if state.tool_name == "calculator":
-		result = eval(state.parameters.get("expression", "0"))
+		# Whitelisted arithmetic only, never a raw eval() of user input
+		result = safe_evaluate(state.parameters.get("expression", "0"))
 		return {"result": result, "success": True}
 	elif state.tool_name == "web_search":
 		query = state.parameters.get("query", "")
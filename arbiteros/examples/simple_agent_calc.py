@@ -8,11 +8,10 @@ Run:
 """
 
 import argparse
-import json
-import math
-import operator
 import ast
-from typing import Any, Dict
+from functools import lru_cache
+from types import CodeType
+from typing import Any, Dict, Union
 
 from pydantic import BaseModel
 
@@ -22,60 +21,51 @@ from arbiteros import (
 	InstructionBinding,
 	InstructionType,
 )
+from arbiteros.examples.utils import pretty_json
 
 # ==========================
 # Safe arithmetic evaluator
 # ==========================
 
-_ALLOWED_NODES = (
+# Every node type an expression may contain; anything else is rejected
+_ALLOWED_NODES = frozenset({
 	ast.Expression,
 	ast.UnaryOp,
 	ast.BinOp,
-	ast.Num,
-	ast.Load,
+	ast.Constant,
+	ast.UAdd,
+	ast.USub,
 	ast.Add,
 	ast.Sub,
 	ast.Mult,
 	ast.Div,
-	ast.Pow,
-	ast.Mod,
-	ast.USub,
-	ast.UAdd,
 	ast.FloorDiv,
-	ast.LParen if hasattr(ast, 'LParen') else ast.AST,  # compatibility
-)
+	ast.Mod,
+	ast.Pow,
+})
+
+# Literal types allowed in expressions (no bools, strings, bytes or None)
+_NUMBER_TYPES = frozenset({int, float, complex})
 
-_OPS = {
-	ast.Add: operator.add,
-	ast.Sub: operator.sub,
-	ast.Mult: operator.mul,
-	ast.Div: operator.truediv,
-	ast.FloorDiv: operator.floordiv,
-	ast.Mod: operator.mod,
-	ast.Pow: operator.pow,
-}
-
-
-def _safe_eval_expr(node: ast.AST) -> float:
-	if isinstance(node, ast.Num):
-		return node.n  # type: ignore
-	elif isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
-		value = _safe_eval_expr(node.operand)
-		return +value if isinstance(node.op, ast.UAdd) else -value
-	elif isinstance(node, ast.BinOp) and type(node.op) in _OPS:
-		left = _safe_eval_expr(node.left)
-		right = _safe_eval_expr(node.right)
-		return _OPS[type(node.op)](left, right)
-	else:
-		raise ValueError("Unsupported expression")
-
-
-def safe_evaluate(expression: str) -> float:
+
+@lru_cache(maxsize=1024)
+def _compile(expression: str) -> CodeType:
+	"""Parse and whitelist an expression once; its code object is cached."""
 	tree = ast.parse(expression, mode="eval")
-	for n in ast.walk(tree):
-		if not isinstance(n, _ALLOWED_NODES):
-			raise ValueError("Invalid token in expression")
-	return float(_safe_eval_expr(tree.body))
+	for node in ast.walk(tree):
+		node_type = type(node)
+		if node_type not in _ALLOWED_NODES:
+			raise ValueError("Unsupported expression")
+		if node_type is ast.Constant and type(node.value) not in _NUMBER_TYPES:  # type: ignore[attr-defined]
+			raise ValueError("Unsupported expression")
+	return compile(tree, "<calc>", "eval")
+
+
+def safe_evaluate(expression: str) -> Union[int, float, complex]:
+	# Only numbers and arithmetic operators get past _compile, so the code
+	# object can't reach any names, builtins or attributes. The value is
+	# returned as evaluated, so "2+2" stays the int 4
+	return eval(_compile(expression), {"__builtins__": {}}, {})
 
 
 # ==========================
@@ -91,7 +81,7 @@ class CalcOutput(BaseModel):
 
 
 def calculator_instruction(state: CalcInput) -> Dict[str, Any]:
-	value = safe_evaluate(state.expression)
+	value = float(safe_evaluate(state.expression))
 	return {"result": value}
 
 
@@ -99,7 +89,9 @@ def calculator_instruction(state: CalcInput) -> Dict[str, Any]:
 # Build and run graph
 # ==========================
 
+@lru_cache(maxsize=1)
 def build_graph() -> ArbiterGraph:
+	"""Build the governed graph once; later calls reuse it."""
 	policy = PolicyConfig(policy_id="calc_policy", description="Calculator policy", rules=[])
 	agent = ArbiterGraph(policy_config=policy, enable_observability=True)
 
@@ -127,10 +119,10 @@ def main() -> None:
 	final_state = agent.execute({"expression": args.expr})
 
 	print("\n=== Calculation Result ===")
-	print(json.dumps({"expression": args.expr, "result": final_state.user_state.get("result")}, indent=2))
+	print(pretty_json({"expression": args.expr, "result": final_state.user_state.get("result")}))
 
 	print("\n=== Trace Summary ===")
-	print(json.dumps(agent.get_trace_summary(), indent=2, default=str))
+	print(pretty_json(agent.get_trace_summary()))
 
 
 if __name__ == "__main__":
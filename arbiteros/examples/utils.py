@@ -0,0 +1,23 @@
+"""Helpers shared by the example scripts and demos."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    # Datetimes go through str() as well, so output matches the json fallback
+    _ORJSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def pretty_json(obj: Any) -> str:
+    """Pretty-print obj as JSON, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, default=str, option=_ORJSON_OPTS).decode()
+        except TypeError:
+            # e.g. ints wider than 64 bits; json.dumps handles those
+            pass
+    return json.dumps(obj, indent=2, default=str, ensure_ascii=False)
@@ -7,9 +7,11 @@ context governance -> strategic oversight with replanning.
 
 Run:
   python -m arbiteros.examples.walkthrough_demo
+  DEMO_VERBOSE=false python -m arbiteros.examples.walkthrough_demo  # without traces
 """
 
-import json
+import os
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
@@ -22,6 +24,7 @@ from arbiteros import (
     InstructionBinding,
     InstructionType,
 )
+from arbiteros.examples.utils import pretty_json
 
 # ==========================
 # Shared Schemas & Helpers
@@ -171,13 +174,20 @@ def instr_fallback(state: FallbackInput) -> Dict[str, Any]:
 # Stage Builders
 # ==========================
 
+@lru_cache(maxsize=None)
+def _binding(**fields: Any) -> InstructionBinding:
+    """Bindings are frozen, so stages declaring the same one share an instance
+    (and the schema validators it builds on first use)."""
+    return InstructionBinding(**fields)
+
+
 def build_stage1_naive() -> ArbiterGraph:
     """Stage 1: Naive brittle sequence: GENERATE -> TOOL_CALL (primary) -> REPORT.
     Demonstrates failure when the primary tool fails (503-like)."""
     policy = PolicyConfig(policy_id="stage1", description="Naive brittle flow", rules=[])
     g = ArbiterGraph(policy_config=policy, enable_observability=True)
 
-    gen = InstructionBinding(
+    gen = _binding(
         id="generate_plan",
         instruction_type=InstructionType.GENERATE,
         input_schema=GeneratePlanInput,
@@ -187,7 +197,7 @@ def build_stage1_naive() -> ArbiterGraph:
         requires_verification=False,
     )
 
-    call = InstructionBinding(
+    call = _binding(
         id="call_primary",
         instruction_type=InstructionType.TOOL_CALL,
         input_schema=ToolCallInput,
@@ -223,7 +233,7 @@ def build_stage2_resilient() -> ArbiterGraph:
     policy = PolicyConfig(policy_id="stage2", description="VERIFY + FALLBACK", rules=rules)
     g = ArbiterGraph(policy_config=policy, enable_observability=True)
 
-    gen = InstructionBinding(
+    gen = _binding(
         id="generate_plan",
         instruction_type=InstructionType.GENERATE,
         input_schema=GeneratePlanInput,
@@ -233,7 +243,7 @@ def build_stage2_resilient() -> ArbiterGraph:
         requires_verification=False,
     )
 
-    verify = InstructionBinding(
+    verify = _binding(
         id="verify_json",
         instruction_type=InstructionType.VERIFY,
         input_schema=VerifyJsonInput,
@@ -242,7 +252,7 @@ def build_stage2_resilient() -> ArbiterGraph:
         description="Verify primary API response is JSON",
     )
 
-    call_primary = InstructionBinding(
+    call_primary = _binding(
         id="call_primary",
         instruction_type=InstructionType.TOOL_CALL,
         input_schema=ToolCallInput,
@@ -251,7 +261,7 @@ def build_stage2_resilient() -> ArbiterGraph:
         description="Call primary financial API",
     )
 
-    call_backup = InstructionBinding(
+    call_backup = _binding(
         id="call_backup",
         instruction_type=InstructionType.TOOL_CALL,
         input_schema=ToolCallInput,
@@ -260,7 +270,7 @@ def build_stage2_resilient() -> ArbiterGraph:
         description="Call cached backup source",
     )
 
-    fallback = InstructionBinding(
+    fallback = _binding(
         id="fallback",
         instruction_type=InstructionType.FALLBACK,
         input_schema=FallbackInput,
@@ -292,7 +302,7 @@ def build_stage3_memory_governance() -> ArbiterGraph:
     policy = PolicyConfig(policy_id="stage3", description="COMPRESS with judge", rules=[])
     g = ArbiterGraph(policy_config=policy, enable_observability=True)
 
-    gen = InstructionBinding(
+    gen = _binding(
         id="generate_plan",
         instruction_type=InstructionType.GENERATE,
         input_schema=GeneratePlanInput,
@@ -301,7 +311,7 @@ def build_stage3_memory_governance() -> ArbiterGraph:
         description="Generate initial plan",
     )
 
-    compress = InstructionBinding(
+    compress = _binding(
         id="compress_notes",
         instruction_type=InstructionType.COMPRESS,
         input_schema=CompressInput,
@@ -310,7 +320,7 @@ def build_stage3_memory_governance() -> ArbiterGraph:
         description="Summarize gathered info with judged confidence",
     )
 
-    call_primary = InstructionBinding(
+    call_primary = _binding(
         id="call_primary",
         instruction_type=InstructionType.TOOL_CALL,
         input_schema=ToolCallInput,
@@ -337,7 +347,7 @@ def build_stage4_metacognitive_replan() -> ArbiterGraph:
     policy = PolicyConfig(policy_id="stage4", description="Evaluate & Replan", rules=[])
     g = ArbiterGraph(policy_config=policy, enable_observability=True)
 
-    gen = InstructionBinding(
+    gen = _binding(
         id="generate_plan",
         instruction_type=InstructionType.GENERATE,
         input_schema=GeneratePlanInput,
@@ -346,7 +356,7 @@ def build_stage4_metacognitive_replan() -> ArbiterGraph:
         description="Generate initial plan",
     )
 
-    evalp = InstructionBinding(
+    evalp = _binding(
         id="evaluate_progress",
         instruction_type=InstructionType.EVALUATE_PROGRESS,
         input_schema=EvalProgressInput,
@@ -355,7 +365,7 @@ def build_stage4_metacognitive_replan() -> ArbiterGraph:
         description="Detect rabbit-holes and low-signal paths",
     )
 
-    replan = InstructionBinding(
+    replan = _binding(
         id="replan",
         instruction_type=InstructionType.REPLAN,
         input_schema=ReplanInput,
@@ -364,7 +374,7 @@ def build_stage4_metacognitive_replan() -> ArbiterGraph:
         description="Strategic replan",
     )
 
-    call_primary = InstructionBinding(
+    call_primary = _binding(
         id="call_primary",
         instruction_type=InstructionType.TOOL_CALL,
         input_schema=ToolCallInput,
@@ -392,6 +402,10 @@ def build_stage4_metacognitive_replan() -> ArbiterGraph:
 # Execution Utilities
 # ==========================
 
+# Same switch as DEMO_VERBOSE in config.py; "false" drops the trace printout
+DEMO_VERBOSE = os.getenv("DEMO_VERBOSE", "true").lower() == "true"
+
+
 def run_stage(title: str, graph: ArbiterGraph, initial_state: Dict[str, Any]) -> None:
     print("\n" + "=" * 70)
     print(f"  {title}")
@@ -400,32 +414,32 @@ def run_stage(title: str, graph: ArbiterGraph, initial_state: Dict[str, Any]) ->
     result = graph.execute(initial_state)
 
     print("Final State Summary:")
-    print(json.dumps(result.get_state_summary(), indent=2))
+    print(pretty_json(result.get_state_summary()))
 
-    trace_summary = graph.get_trace_summary()
-    print("\nTrace Summary:")
-    print(json.dumps(trace_summary, indent=2, default=str))
+    # The trace is the bulk of the output; skip building it when not wanted
+    if DEMO_VERBOSE:
+        trace_summary = graph.get_trace_summary()
+        print("\nTrace Summary:")
+        print(pretty_json(trace_summary))
 
 
-def main() -> None:
+# (title, builder, initial state) per stage, in order
+_STAGES = [
     # Stage 1: Naive brittle flow - primary tool fails (force_503)
-    stage1 = build_stage1_naive()
-    run_stage(
+    (
         "Stage 1: Naive Prototype (Brittle Execution)",
-        stage1,
+        build_stage1_naive,
         {
             "goal": "market analysis report",
             "tool_name": "primary_fin_api",
             "parameters": {"force_503": True},  # simulate 503 failure
         },
-    )
-
+    ),
     # Stage 2: Add VERIFY + FALLBACK -> backup source
-    stage2 = build_stage2_resilient()
     # For demo simplicity, we pass the "content" to verify_json as what generate/tool produced next
-    run_stage(
+    (
         "Stage 2: Resilience via VERIFY + FALLBACK",
-        stage2,
+        build_stage2_resilient,
         {
             "goal": "market analysis report",
             # simulate that verify will fail if content isn't JSON; we keep flow linear
@@ -433,13 +447,11 @@ def main() -> None:
             "tool_name": "primary_fin_api",
             "parameters": {"force_503": True},
         },
-    )
-
+    ),
     # Stage 3: Governed memory (COMPRESS + judged confidence)
-    stage3 = build_stage3_memory_governance()
-    run_stage(
+    (
         "Stage 3: Governing Context (COMPRESS with LLM-as-judge)",
-        stage3,
+        build_stage3_memory_governance,
         {
             "goal": "market analysis report",
             "text": (
@@ -450,13 +462,11 @@ def main() -> None:
             "tool_name": "primary_fin_api",
             "parameters": {"force_503": False},
         },
-    )
-
+    ),
     # Stage 4: Metacognitive oversight (EVALUATE_PROGRESS -> REPLAN)
-    stage4 = build_stage4_metacognitive_replan()
-    run_stage(
+    (
         "Stage 4: Strategic Oversight (EVALUATE_PROGRESS -> REPLAN)",
-        stage4,
+        build_stage4_metacognitive_replan,
         {
             "goal": "market analysis report",
             "current_step": 6,  # high step count to trigger fail
@@ -466,7 +476,13 @@ def main() -> None:
             "tool_name": "primary_fin_api",
             "parameters": {"force_503": False},
         },
-    )
+    ),
+]
+
+
+def main() -> None:
+    for title, build, initial_state in _STAGES:
+        run_stage(title, build(), initial_state)
 
 
 if __name__ == "__main__":
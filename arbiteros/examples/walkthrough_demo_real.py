@@ -8,16 +8,26 @@ optionally falls back to Wikipedia page extracts if needed.
 
 Run:
   python -m arbiteros.examples.walkthrough_demo_real --query "NVIDIA Q2 earnings"
+  python -m arbiteros.examples.walkthrough_demo_real --query "NVIDIA Q2 earnings" --stage 3
 """
 
 import argparse
-import json
+import importlib.util
 import re
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+from urllib.parse import quote
 
 import httpx
 from pydantic import BaseModel
 
+try:
+	from selectolax.lexbor import LexborHTMLParser
+	SELECTOLAX_AVAILABLE = True
+except ImportError:
+	SELECTOLAX_AVAILABLE = False
+
 from arbiteros import (
 	ArbiterGraph,
 	PolicyConfig,
@@ -26,6 +36,7 @@ from arbiteros import (
 	InstructionBinding,
 	InstructionType,
 )
+from arbiteros.examples.utils import pretty_json
 
 # ==========================
 # Simple web utilities (synchronous)
@@ -38,61 +49,105 @@ WIKI_SUMMARY_API = "https://en.wikipedia.org/api/rest_v1/page/summary/{}"
 WIKI_PAGE_TEXT = "https://r.jina.ai/http://en.wikipedia.org/wiki/{}"  # read-only text proxy
 
 
+@lru_cache(maxsize=1)
 def _client() -> httpx.Client:
-	return httpx.Client(timeout=20, headers={
+	"""HTTP client shared by every fetch, so connections survive between fallbacks."""
+	return httpx.Client(http2=importlib.util.find_spec("h2") is not None, timeout=20, headers={
 		"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
 			"(KHTML, like Gecko) Chrome/124.0 Safari/537.36",
 		"Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
 	})
 
 
-def fetch_duckduckgo(query: str) -> str:
-	params = {"q": query}
-	with _client() as client:
-		r = client.get(DUCK_URL, params=params)
+_SNIPPET_MARKER = b"result__snippet"
+
+
+def _fetch_results_html(url: str, query: str, limit: int) -> str:
+	"""Results page HTML, read only until it holds limit complete results."""
+	body = bytearray()
+	seen = 0
+	with _client().stream("GET", url, params={"q": query}) as r:
 		r.raise_for_status()
-		return r.text
+		for chunk in r.iter_bytes(chunk_size=8192):
+			# Count only markers that end in the new chunk
+			start = max(0, len(body) - len(_SNIPPET_MARKER) + 1)
+			body += chunk
+			seen += body.count(_SNIPPET_MARKER, start)
+			# Once a further snippet starts, the first limit results are complete
+			if seen > limit:
+				break
+		return bytes(body).decode(r.encoding or "utf-8", "replace")
 
 
-def fetch_duckduckgo_alt(query: str) -> str:
+def fetch_duckduckgo(query: str, limit: int = 5) -> str:
+	return _fetch_results_html(DUCK_URL, query, limit)
+
+
+def fetch_duckduckgo_alt(query: str, limit: int = 5) -> str:
 	# Read-only fetch through r.jina.ai mirror, useful when direct access fails
-	params = {"q": query}
-	with _client() as client:
-		r = client.get(DUCK_URL_ALT, params=params)
-		r.raise_for_status()
-		return r.text
+	return _fetch_results_html(DUCK_URL_ALT, query, limit)
 
 
 def fetch_duckduckgo_instant(query: str) -> str:
 	# DuckDuckGo Instant Answer API (no key). Returns concise abstract + related topics.
 	params = {"q": query, "format": "json", "no_html": 1, "skip_disambig": 1}
-	with httpx.Client(timeout=15, headers={"User-Agent": "Mozilla/5.0"}) as client:
-		r = client.get(DUCK_INSTANT_API, params=params)
-		r.raise_for_status()
-		data = r.json()
-		abstract = (data.get("AbstractText") or "").strip()
-		related = []
-		for t in data.get("RelatedTopics", [])[:5]:
-			text = t.get("Text") if isinstance(t, dict) else None
+	r = _client().get(DUCK_INSTANT_API, params=params, headers={"User-Agent": "Mozilla/5.0"}, timeout=15)
+	r.raise_for_status()
+	data = r.json()
+	abstract = (data.get("AbstractText") or "").strip()
+	related = [t["Text"] for t in data.get("RelatedTopics", [])[:5] if isinstance(t, dict) and t.get("Text")]
+	text_parts = []
+	if abstract:
+		text_parts.append(abstract)
+	if related:
+		text_parts.append("\n".join(related))
+	return "\n".join(text_parts)
+
+
+_RE_RESULT = re.compile(r"<a.*?class=\"result__a.*?>(.*?)</a>.*?<a.*?result__snippet.*?>(.*?)</a>", re.S)
+_RE_RESULT_TITLE = re.compile(r"<a[^>]*class=\"result__a[^\"]*\"[^>]*>(.*?)</a>", re.S)
+_RE_TAG = re.compile("<.*?>")
+_RE_WS = re.compile(r"\s+")
+
+
+def _snippets_from_dom(html: str, limit: int) -> List[str]:
+	"""CSS-selector version of extract_snippets_from_duck (needs selectolax)."""
+	tree = LexborHTMLParser(html)
+	snippets: List[str] = []
+	for result in tree.css(".result"):
+		title = result.css_first("a.result__a")
+		snippet = result.css_first(".result__snippet")
+		if title is None or snippet is None:
+			continue
+		text = f"{title.text()} - {snippet.text()}"
+		snippets.append(_RE_WS.sub(" ", text).strip())
+		if len(snippets) >= limit:
+			return snippets
+	if not snippets:
+		for title in tree.css("a.result__a"):
+			text = title.text().strip()
 			if text:
-				related.append(text)
-		text_parts = [p for p in [abstract, "\n".join(related)] if p]
-		return "\n".join(text_parts)
+				snippets.append(text)
+				if len(snippets) >= limit:
+					break
+	return snippets
 
 
 def extract_snippets_from_duck(html: str, limit: int = 5) -> List[str]:
+	if SELECTOLAX_AVAILABLE:
+		return _snippets_from_dom(html, limit)
 	snippets: List[str] = []
-	for m in re.finditer(r"<a.*?class=\"result__a.*?>(.*?)</a>.*?<a.*?result__snippet.*?>(.*?)</a>", html, re.S):
-		title = re.sub("<.*?>", "", m.group(1))
-		snippet = re.sub("<.*?>", "", m.group(2))
+	for m in _RE_RESULT.finditer(html):
+		title = _RE_TAG.sub("", m.group(1))
+		snippet = _RE_TAG.sub("", m.group(2))
 		text = f"{title} - {snippet}"
-		snippets.append(re.sub(r"\s+", " ", text).strip())
+		snippets.append(_RE_WS.sub(" ", text).strip())
 		if len(snippets) >= limit:
 			break
 	# 兜底：若选择器失效，退化为提取 <a ... result__a> 的标题
 	if not snippets:
-		for m in re.finditer(r"<a[^>]*class=\"result__a[^\"]*\"[^>]*>(.*?)</a>", html, re.S):
-			title = re.sub("<.*?>", "", m.group(1))
+		for m in _RE_RESULT_TITLE.finditer(html):
+			title = _RE_TAG.sub("", m.group(1))
 			if title:
 				snippets.append(title.strip())
 				if len(snippets) >= limit:
@@ -100,26 +155,33 @@ def extract_snippets_from_duck(html: str, limit: int = 5) -> List[str]:
 	return snippets
 
 
+# Article titles use underscores for spaces
+_SLUG_TRANS = str.maketrans({" ": "_"})
+
+
+def _wiki_slug(topic: str) -> str:
+	"""Article slug for topic, percent-encoded so non-ASCII titles resolve."""
+	return quote(topic.strip().translate(_SLUG_TRANS), safe="_")
+
+
 def fetch_wikipedia_summary(topic: str) -> str:
-	slug = topic.strip().replace(" ", "_")
+	slug = _wiki_slug(topic)
 	url = WIKI_SUMMARY_API.format(slug)
-	with _client() as client:
-		r = client.get(url)
-		if r.status_code == 200:
-			data = r.json()
-			return data.get("extract", "")
+	r = _client().get(url)
+	if r.status_code == 200:
+		data = r.json()
+		return data.get("extract", "")
 	return ""
 
 
 def fetch_wikipedia_page_text(topic: str) -> str:
-	slug = topic.strip().replace(" ", "_")
+	slug = _wiki_slug(topic)
 	url = WIKI_PAGE_TEXT.format(slug)
-	with httpx.Client(timeout=20, headers={"User-Agent": "Mozilla/5.0"}) as client:
-		r = client.get(url)
-		if r.status_code == 200:
-			text = r.text
-			# r.jina.ai 返回的已是可读文本，不需要复杂清洗；简单裁剪
-			return text.strip()
+	r = _client().get(url, headers={"User-Agent": "Mozilla/5.0"})
+	if r.status_code == 200:
+		text = r.text
+		# r.jina.ai 返回的已是可读文本，不需要复杂清洗；简单裁剪
+		return text.strip()
 	return ""
 
 
@@ -138,6 +200,7 @@ class PlanOutput(BaseModel):
 
 class SearchInput(BaseModel):
 	query: str
+	# Simulate an outage: fail at once without touching the network
 	force_fail: bool = False
 
 
@@ -204,38 +267,97 @@ def impl_plan(state: PlanInput) -> Dict[str, Any]:
 	return {"plan": plan, "tokens_used": len(plan) + len(state.query)}
 
 
-def _best_effort_search_text(query: str) -> str:
-	# 尝试顺序：DDG Instant → DDG HTML → DDG（jina 代理）→ Wikipedia 摘要 → Wikipedia 页面文本 → 兜底提示
+def _instant_text(query: str) -> str:
+	ia = fetch_duckduckgo_instant(query)
+	return ia if ia and len(ia.strip()) > 0 else ""
+
+
+def _duck_text(query: str) -> str:
+	return "\n".join(extract_snippets_from_duck(fetch_duckduckgo(query), 5))
+
+
+def _duck_alt_text(query: str) -> str:
+	return "\n".join(extract_snippets_from_duck(fetch_duckduckgo_alt(query), 5))
+
+
+def _wiki_page_excerpt(query: str) -> str:
+	page_text = fetch_wikipedia_page_text(query)
+	if page_text:
+		return page_text[:1000] + ("..." if len(page_text) > 1000 else "")
+	return ""
+
+
+# 尝试顺序：DDG Instant → DDG HTML → DDG（jina 代理）→ Wikipedia 摘要 → Wikipedia 页面文本 → 兜底提示
+# (source, whether its errors are swallowed)
+_SEARCH_SOURCES = [
+	(_instant_text, True),
+	(_duck_text, True),
+	(_duck_alt_text, True),
+	(fetch_wikipedia_summary, False),
+	(_wiki_page_excerpt, False),
+]
+# Single proper nouns ("NVIDIA") are usually answered by the Wikipedia
+# summary, so it goes first for them; ahead of DDG its errors are swallowed
+_ENTITY_SEARCH_SOURCES = [(fetch_wikipedia_summary, True)] + [
+	entry for entry in _SEARCH_SOURCES if entry[0] is not fetch_wikipedia_summary
+]
+
+
+def _looks_like_entity(query: str) -> bool:
+	words = query.split()
+	return len(words) == 1 and words[0][:1].isupper()
+
+
+@lru_cache(maxsize=128)
+def _search_text(query: str) -> str:
+	"""First usable text for query, memoized; raises LookupError if none.
+
+	Misses raise rather than return, so lru_cache never remembers them and
+	a later stage retries the network.
+	"""
+	sources = _ENTITY_SEARCH_SOURCES if _looks_like_entity(query) else _SEARCH_SOURCES
+	# The primary source usually answers, so the fallbacks are only fetched
+	# once it has failed
+	(primary, primary_guarded), fallbacks = sources[0], sources[1:]
 	try:
-		ia = fetch_duckduckgo_instant(query)
-		if ia and len(ia.strip()) > 0:
-			return ia
+		text = primary(query)
 	except Exception:
-		pass
+		if not primary_guarded:
+			raise
+		text = ""
+	if text:
+		return text
+	# Fallbacks run two at a time, but results are still taken in priority
+	# order; once one answers, the ones not started yet are cancelled
+	pool = ThreadPoolExecutor(max_workers=2)
+	futures = [pool.submit(source, query) for source, _ in fallbacks]
 	try:
-		html = fetch_duckduckgo(query)
-		snips = extract_snippets_from_duck(html, 5)
-		if snips:
-			return "\n".join(snips)
-	except Exception:
-		pass
+		for future, (_, guarded) in zip(futures, fallbacks):
+			try:
+				text = future.result()
+			except Exception:
+				if not guarded:
+					raise
+				continue
+			if text:
+				return text
+	finally:
+		for future in futures:
+			future.cancel()
+		pool.shutdown(wait=False)
+	raise LookupError(query)
+
+
+def _best_effort_search_text(query: str) -> str:
 	try:
-		html2 = fetch_duckduckgo_alt(query)
-		snips2 = extract_snippets_from_duck(html2, 5)
-		if snips2:
-			return "\n".join(snips2)
-	except Exception:
-		pass
-	wiki = fetch_wikipedia_summary(query)
-	if wiki:
-		return wiki
-	page_text = fetch_wikipedia_page_text(query)
-	if page_text:
-		return page_text[:1000] + ("..." if len(page_text) > 1000 else "")
-	return "No public summary available. Please check network or try another query."
+		return _search_text(query)
+	except LookupError:
+		return "No public summary available. Please check network or try another query."
 
 
 def impl_search(state: SearchInput) -> Dict[str, Any]:
+	if state.force_fail:
+		return {"text": "Simulated 503 failure", "success": False}
 	text = _best_effort_search_text(state.query)
 	return {"text": text, "success": text != "" and not text.startswith("No public summary")}
 
@@ -249,17 +371,23 @@ def impl_verify(state: VerifyInput) -> Dict[str, Any]:
 
 def impl_compress(state: CompressInput) -> Dict[str, Any]:
 	text = state.text
-	if len(text) <= state.target_length:
+	n = len(text)
+	target = state.target_length
+	if n <= target:
 		summary = text
 	else:
-		summary = text[: state.target_length] + "..."
-	ratio = min(1.0, state.target_length / max(1, len(text)))
+		summary = text[:target] + "..."
+	ratio = min(1.0, target / max(1, n))
 	judge_confidence = 0.8 + 0.2 * ratio
 	return {"summary": summary, "judge_confidence": judge_confidence}
 
 
+# Notes that mean the run has drifted
+_EVAL_BAD_RE = re.compile(r"rabbit hole|irrelevant|off-topic", re.IGNORECASE)
+
+
 def impl_eval(state: EvalInput) -> Dict[str, Any]:
-	bad = any(k in state.notes.lower() for k in ["rabbit hole", "irrelevant", "off-topic"]) or state.step > 6
+	bad = state.step > 6 or _EVAL_BAD_RE.search(state.notes) is not None
 	return {"passed": not bad, "reason": "on_track" if not bad else "need_replan"}
 
 
@@ -456,40 +584,56 @@ def build_stage4(query: str) -> ArbiterGraph:
 # Run all stages end-to-end
 # ==========================
 
-def run(query: str) -> None:
+def run(query: str, stages: Optional[Sequence[int]] = None) -> None:
+	"""Run the selected stages (default: all); only those graphs get built."""
+	selected = set(stages or (1, 2, 3, 4))
+
 	# Stage 1 (simulate failure)
-	s1 = build_stage1(query)
-	r1 = s1.execute({"query": query, "force_fail": True})
-	print("\n=== Stage 1: Naive (expected brittle) ===")
-	print(json.dumps(r1.get_state_summary(), indent=2))
+	if 1 in selected:
+		s1 = build_stage1(query)
+		r1 = s1.execute({"query": query, "force_fail": True})
+		print("\n=== Stage 1: Naive (expected brittle) ===")
+		print(pretty_json(r1.get_state_summary()))
 
 	# Stage 2 (verify then search)
-	s2 = build_stage2(query)
-	r2 = s2.execute({"query": query, "content": "<html>503 Service Unavailable</html>", "criteria": "signal", "force_fail": False})
-	print("\n=== Stage 2: VERIFY + fallback-ready ===")
-	print(json.dumps(r2.get_state_summary(), indent=2))
-
-	# Stage 3 (compress results)
-	s3 = build_stage3(query)
-	r3 = s3.execute({"query": query, "force_fail": False})
-	print("\n=== Stage 3: Governed memory (COMPRESS) ===")
-	print(json.dumps(r3.get_state_summary(), indent=2))
-	compressed = r3.user_state.get("summary", "")
+	if 2 in selected:
+		s2 = build_stage2(query)
+		r2 = s2.execute({"query": query, "content": "<html>503 Service Unavailable</html>", "criteria": "signal", "force_fail": False})
+		print("\n=== Stage 2: VERIFY + fallback-ready ===")
+		print(pretty_json(r2.get_state_summary()))
+
+	# Stage 3 (compress results); Stage 4 reports on its summary, so it runs
+	# for either, but is only printed when selected
+	if selected & {3, 4}:
+		s3 = build_stage3(query)
+		r3 = s3.execute({"query": query, "force_fail": False})
+		if 3 in selected:
+			print("\n=== Stage 3: Governed memory (COMPRESS) ===")
+			print(pretty_json(r3.get_state_summary()))
+		compressed = r3.user_state.get("summary", "")
 
 	# Stage 4 (evaluate -> replan -> report)
-	s4 = build_stage4(query)
-	r4 = s4.execute({"query": query, "notes": compressed[:200], "step": 7, "plan": "naive-plan", "issue": "need_focus", "summary": compressed})
-	print("\n=== Stage 4: Evaluate + Replan + Report ===")
-	print(json.dumps(r4.get_state_summary(), indent=2))
-	print("\n=== Final Report ===\n")
-	print(r4.user_state.get("report", "<no report>"))
+	if 4 in selected:
+		s4 = build_stage4(query)
+		r4 = s4.execute({"query": query, "notes": compressed[:200], "step": 7, "plan": "naive-plan", "issue": "need_focus", "summary": compressed})
+		print("\n=== Stage 4: Evaluate + Replan + Report ===")
+		print(pretty_json(r4.get_state_summary()))
+		print("\n=== Final Report ===\n")
+		print(r4.user_state.get("report", "<no report>"))
 
 
 def main() -> None:
 	parser = argparse.ArgumentParser(description="Real Walkthrough Demo")
 	parser.add_argument("--query", required=True, help="Topic to research (e.g., 'NVIDIA Q2 earnings')")
+	parser.add_argument(
+		"--stage",
+		type=int,
+		choices=[1, 2, 3, 4],
+		action="append",
+		help="Stage to run; repeat for several (default: all)",
+	)
 	args = parser.parse_args()
-	run(args.query)
+	run(args.query, args.stage)
 
 
 if __name__ == "__main__":
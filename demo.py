@@ -7,14 +7,9 @@ including governance, observability, and the migration assistant.
 """
 
 import os
-import sys
-import json
 import asyncio
-from pathlib import Path
-from typing import Dict, Any
-
-# Add the current directory to Python path
-sys.path.insert(0, str(Path(__file__).parent))
+from functools import lru_cache
+from typing import Dict, Any, Tuple
 
 from arbiteros import (
     ArbiterGraph, 
@@ -25,8 +20,13 @@ from arbiteros import (
     InstructionType,
     ManagedState
 )
+from arbiteros.examples.simple_agent_calc import safe_evaluate
+from arbiteros.examples.utils import pretty_json
 from pydantic import BaseModel, Field
 
+# Test case 2's prompt, long enough to break the content-length rule
+_LONG_PROMPT = "A" * 2000
+
 
 class GenerateInput(BaseModel):
     prompt: str
@@ -70,13 +70,17 @@ class FallbackOutput(BaseModel):
     recovery_action: str
 
 
+_RESPONSE_PREFIX = "Generated response for: "
+_RESPONSE_PREFIX_LEN = len(_RESPONSE_PREFIX)
+
+
 def generate_instruction(state: GenerateInput) -> Dict[str, Any]:
     """Generate instruction that simulates LLM output."""
-    # Simulate LLM generation
-    response = f"Generated response for: {state.prompt}"
+    # Simulate LLM generation; the response is the prompt plus a fixed prefix
+    prompt = state.prompt
     return {
-        "text": response,
-        "tokens_used": len(state.prompt) + len(response)
+        "text": _RESPONSE_PREFIX + prompt,
+        "tokens_used": 2 * len(prompt) + _RESPONSE_PREFIX_LEN
     }
 
 
@@ -84,7 +88,8 @@ def tool_call_instruction(state: ToolCallInput) -> Dict[str, Any]:
     """Tool call instruction that simulates external tool execution."""
     if state.tool_name == "calculator":
         try:
-            result = eval(state.parameters.get("expression", "0"))
+            # Whitelisted arithmetic only, never a raw eval() of user input
+            result = safe_evaluate(state.parameters.get("expression", "0"))
             return {"result": result, "success": True}
         except Exception as e:
             return {"result": None, "success": False, "error": str(e)}
@@ -95,15 +100,26 @@ def tool_call_instruction(state: ToolCallInput) -> Dict[str, Any]:
         return {"result": None, "success": False}
 
 
+@lru_cache(maxsize=1024)
+def _verify_core(content_length: int) -> Tuple[bool, float, str]:
+    """Verdict for content of the given length (all the check looks at)."""
+    confidence = min(0.9, content_length / 100.0)
+    return (
+        confidence > 0.5,
+        confidence,
+        f"Content length: {content_length}, confidence: {confidence:.2f}"
+    )
+
+
 def verify_instruction(state: VerifyInput) -> Dict[str, Any]:
     """Verification instruction that checks content quality."""
-    content_length = len(state.content)
-    confidence = min(0.9, content_length / 100.0)
-    
+    # Keyed on the length, so retries with the same content skip the
+    # formatting and no large strings are held by the cache
+    passed, confidence, reasoning = _verify_core(len(state.content))
     return {
-        "passed": confidence > 0.5,
+        "passed": passed,
         "confidence": confidence,
-        "reasoning": f"Content length: {content_length}, confidence: {confidence:.2f}"
+        "reasoning": reasoning
     }
 
 
@@ -228,20 +244,22 @@ def create_demo_agent():
     return arbiter_graph
 
 
+_RULE = "=" * 60
+
+
 def print_section(title: str, content: str = ""):
     """Print a formatted section."""
-    print(f"\n{'='*60}")
-    print(f"  {title}")
-    print(f"{'='*60}")
+    # One write per section rather than one per line
+    lines = ["", _RULE, f"  {title}", _RULE]
     if content:
-        print(content)
+        lines.append(content)
+    print("\n".join(lines))
 
 
 def print_json(data: Any, title: str = ""):
     """Print JSON data with optional title."""
-    if title:
-        print(f"\n{title}:")
-    print(json.dumps(data, indent=2, default=str))
+    text = pretty_json(data)
+    print(f"\n{title}:\n{text}" if title else text)
 
 
 async def main():
@@ -268,14 +286,15 @@ async def main():
     
     # Show instruction bindings
     print_section("🔧 Instruction Bindings")
-    bindings_info = []
-    for binding_id, binding in agent.instruction_bindings.items():
-        bindings_info.append({
+    bindings_info = [
+        {
             "id": binding.id,
-            "type": binding.instruction_type.value,
+            "type": binding.type_name,
             "description": binding.description,
             "requires_verification": binding.requires_verification
-        })
+        }
+        for binding in agent.instruction_bindings.values()
+    ]
     print_json(bindings_info, "Available Instructions")
     
     # Execute the agent
@@ -310,7 +329,7 @@ async def main():
     print("\n📝 Test Case 2: Policy Violation (Long Content)")
     try:
         result2 = agent.execute({
-            "prompt": "A" * 2000,  # Very long prompt to trigger policy violation
+            "prompt": _LONG_PROMPT,  # Very long prompt to trigger policy violation
             "tool_name": "calculator",
             "parameters": {"expression": "2 + 2"}
         })
@@ -320,7 +339,7 @@ async def main():
         
         # Show policy violations
         if result2.os_metadata.policy_violations:
-            print_json(result2.os_metadata.policy_violations, "Policy Violations")
+            print_json(list(result2.os_metadata.policy_violations), "Policy Violations")
         
     except Exception as e:
         print(f"❌ Execution failed: {e}")
@@ -339,7 +358,7 @@ async def main():
         
         # Show errors
         if result3.os_metadata.errors:
-            print_json(result3.os_metadata.errors, "Errors")
+            print_json(list(result3.os_metadata.errors), "Errors")
         
     except Exception as e:
         print(f"❌ Execution failed: {e}")
@@ -6,10 +6,40 @@ This script provides an easy way to run the ArbiterOS-Core demo
 and test the system functionality.
 """
 
+import asyncio
+import contextlib
+import io
 import os
+import signal
 import sys
-import subprocess
+import traceback
+from importlib.util import find_spec
 from pathlib import Path
+from typing import Any, Callable, Tuple
+
+# test_basic.py and demo.py live next to this script
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def _call_quietly(func: Callable[[], Any], timeout: int) -> Tuple[Any, str]:
+    """Call func in-process with its output captured.
+
+    Raises TimeoutError after timeout seconds where SIGALRM exists (Unix).
+    """
+    buf = io.StringIO()
+    use_alarm = hasattr(signal, "SIGALRM")
+    if use_alarm:
+        def _expire(signum: int, frame: Any) -> None:
+            raise TimeoutError
+        previous = signal.signal(signal.SIGALRM, _expire)
+        signal.alarm(timeout)
+    try:
+        with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+            return func(), buf.getvalue()
+    finally:
+        if use_alarm:
+            signal.alarm(0)
+            signal.signal(signal.SIGALRM, previous)
 
 
 def check_dependencies():
@@ -26,10 +56,10 @@ def check_dependencies():
     missing_packages = []
     
     for package in required_packages:
-        try:
-            __import__(package)
+        # Locate the package without running its (heavy) __init__
+        if find_spec(package) is not None:
             print(f"  ✅ {package}")
-        except ImportError:
+        else:
             print(f"  ❌ {package} (missing)")
             missing_packages.append(package)
     
@@ -47,18 +77,18 @@ def run_basic_test():
     print("\n🧪 Running basic functionality test...")
     
     try:
-        result = subprocess.run([
-            sys.executable, "test_basic.py"
-        ], capture_output=True, text=True, timeout=30)
+        # In-process, so the arbiteros/langgraph imports are paid only once
+        import test_basic
+        passed, output = _call_quietly(test_basic.main, timeout=30)
         
-        if result.returncode == 0:
+        if passed:
             print("✅ Basic test passed!")
             return True
         else:
-            print(f"❌ Basic test failed: {result.stderr}")
+            print(f"❌ Basic test failed: {output}")
             return False
             
-    except subprocess.TimeoutExpired:
+    except TimeoutError:
         print("❌ Basic test timed out")
         return False
     except Exception as e:
@@ -71,23 +101,22 @@ def run_demo():
     print("\n🚀 Running ArbiterOS-Core demo...")
     
     try:
-        result = subprocess.run([
-            sys.executable, "demo.py"
-        ], capture_output=True, text=True, timeout=60)
-        
-        if result.returncode == 0:
-            print("✅ Demo completed successfully!")
-            return True
-        else:
-            print(f"❌ Demo failed: {result.stderr}")
-            return False
-            
-    except subprocess.TimeoutExpired:
+        import demo
+        _call_quietly(lambda: asyncio.run(demo.main()), timeout=60)
+    except TimeoutError:
         print("❌ Demo timed out")
         return False
-    except Exception as e:
-        print(f"❌ Demo error: {e}")
+    except SystemExit as e:
+        # What a subprocess would report as its return code
+        if e.code not in (None, 0):
+            print(f"❌ Demo failed: exit code {e.code}")
+            return False
+    except Exception:
+        print(f"❌ Demo failed: {traceback.format_exc()}")
         return False
+    
+    print("✅ Demo completed successfully!")
+    return True
 
 
 def show_usage():
@@ -1,8 +1,22 @@
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Optionally compile the migration analyzer with mypyc (ARBITEROS_USE_MYPYC=1).
+# The pure-Python package is built otherwise and behaves identically.
+ext_modules = []
+if os.getenv("ARBITEROS_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify([
+        "--follow-imports=silent",
+        "--ignore-missing-imports",
+        "arbiteros/cli/analyzer.py",
+    ])
+
 setup(
     name="arbiteros-core",
     version="0.1.0",
@@ -13,6 +27,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/arbiteros/arbiteros-core",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -36,7 +51,7 @@ setup(
         "opentelemetry-api>=1.20.0",
         "opentelemetry-sdk>=1.20.0",
         "opentelemetry-instrumentation>=0.41b0",
-        "opentelemetry-exporter-jaeger>=1.20.0",
+        "opentelemetry-exporter-otlp-proto-grpc>=1.20.0",
         "redis>=5.0.0",
         "langgraph-checkpoint-redis>=0.1.0",
         "click>=8.0.0",
@@ -55,6 +70,14 @@ setup(
         "examples": [
             "httpx>=0.25.0",
             "aiohttp>=3.8.0",
+            "selectolax>=0.3.21",
+        ],
+        "fast": [
+            "orjson>=3.9.0",
+            "msgspec>=0.18.0",
+        ],
+        "hyperscan": [
+            "hyperscan>=0.4.0",
         ],
     },
     entry_points={
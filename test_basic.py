@@ -2,10 +2,6 @@
 """Basic test for ArbiterOS-Core functionality."""
 
 import sys
-from pathlib import Path
-
-# Add the current directory to Python path
-sys.path.insert(0, str(Path(__file__).parent))
 
 from arbiteros import (
     ArbiterGraph, 
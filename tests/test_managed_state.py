@@ -0,0 +1,96 @@
+"""Tests for ManagedState."""
+
+import json
+
+from arbiteros.core.managed_state import ManagedState
+
+
+def test_update_os_metadata_keeps_history_fields_bounded():
+    state = ManagedState()
+    state.update_os_metadata({"errors": [{"error": "old"}], "recent_instructions": list("abcdefg")})
+
+    state.add_error({"error": "new"})
+    state.add_policy_violation({"rule": "r"})
+
+    assert [error["error"] for error in state.os_metadata.errors] == ["old", "new"]
+    assert state.os_metadata.errors.maxlen == state.os_metadata.MAX_HISTORY
+    assert list(state.os_metadata.recent_instructions) == list("cdefg")
+
+
+def test_to_dict_view_has_the_same_keys_as_to_dict():
+    state = ManagedState(user_state={"a": 1})
+    view = state.to_dict_view()
+    mutable = state.to_dict()
+
+    assert list(view) == list(mutable)
+    assert list(view["os_metadata"]) == list(mutable["os_metadata"])
+    assert "last_updated" in view["os_metadata"]
+    assert "last_updated_ns" not in view["os_metadata"]
+
+    state.add_error({"error": "late"})
+    assert view["os_metadata"]["errors"][-1]["error"] == "late"
+
+
+def test_serialize_does_not_depend_on_the_encoder(monkeypatch):
+    from arbiteros.core import managed_state
+
+    state = ManagedState(user_state={"name": "é", "n": 1.5})
+    first = state.serialize()
+    monkeypatch.setattr(managed_state, "ORJSON_AVAILABLE", not managed_state.ORJSON_AVAILABLE)
+    second = state.serialize()
+
+    assert first == second
+    assert '"start_time":"' + state.os_metadata.start_time.isoformat() + '"' in first
+
+
+def test_serialize_handles_ints_wider_than_64_bits():
+    state = ManagedState(user_state={"big": 2 ** 70})
+    assert ManagedState.deserialize(state.serialize()).user_state["big"] == 2 ** 70
+
+
+def test_health_follows_direct_field_assignments():
+    state = ManagedState()
+    assert state.is_healthy() and not state.requires_attention()
+
+    state.os_metadata.fallback_triggered = True
+    assert not state.is_healthy()
+
+    state.os_metadata.fallback_triggered = False
+    state.os_metadata.policy_violations.append({"rule": "r"})
+    assert state.is_healthy() and state.requires_attention()
+
+
+def test_to_dict_is_a_plain_snapshot():
+    state = ManagedState(user_state={"a": 1})
+    snapshot = state.to_dict()
+    state.add_error({"error": "late"})
+
+    assert type(snapshot) is dict and type(snapshot["os_metadata"]) is dict
+    assert snapshot["os_metadata"]["errors"] == []
+    json.dumps(snapshot, default=str)
+
+
+def test_loading_a_long_history_counts_and_keeps_the_overflow():
+    from arbiteros.core.managed_state import StateMetadata
+    from arbiteros.core.observability import FlightDataRecorder
+
+    cap = StateMetadata.MAX_HISTORY
+    errors = [{"error": str(n)} for n in range(cap + 3)]
+    state = ManagedState.from_dict({"os_metadata": {"execution_id": "e", "errors": errors, "dropped_errors": 2}})
+
+    assert len(state.os_metadata.errors) == cap
+    assert state.os_metadata.dropped_errors == 5
+
+    state.update_os_metadata({"policy_violations": [{"rule": n} for n in range(cap + 1)]})
+    assert state.os_metadata.dropped_policy_violations == 1
+
+    recorder = FlightDataRecorder(enable_otel=False)
+    for overflow in state.take_history_overflow():
+        recorder.record_history_overflow(overflow["field"], overflow["entries"], "e")
+    assert state.take_history_overflow() == []
+
+    events = recorder.get_execution_trace("e")
+    assert [(event.data["field"], event.data["dropped"]) for event in events] == [
+        ("errors", 3), ("policy_violations", 1)
+    ]
+    assert events[0].data["entries"][0] == {"error": "0"}
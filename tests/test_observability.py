@@ -0,0 +1,133 @@
+"""Tests for the Flight Data Recorder."""
+
+import json
+import threading
+import time
+
+import pytest
+
+from arbiteros.core.observability import FlightDataRecorder
+
+
+def test_reads_finish_while_another_thread_keeps_recording():
+    """A reader drains a bounded batch instead of chasing the producer."""
+    recorder = FlightDataRecorder(enable_otel=False, drain_interval=None)
+    stop = threading.Event()
+
+    def produce():
+        while not stop.is_set():
+            recorder.record_event("tick", {"n": 1}, execution_id="exec")
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    time.sleep(0.05)
+
+    reads = []
+    reader = threading.Thread(
+        target=lambda: reads.append(len(recorder.get_execution_trace("exec"))),
+        daemon=True
+    )
+    reader.start()
+    reader.join(timeout=5)
+    stop.set()
+    producer.join()
+
+    assert not reader.is_alive()
+    assert reads[0] > 0
+    assert len(recorder.get_execution_trace("exec")) >= reads[0]
+
+
+def test_traces_is_a_snapshot_and_clear_drops_queued_events():
+    recorder = FlightDataRecorder(enable_otel=False)
+    assert recorder._drain_worker is None
+
+    recorder.record_event("a", {}, execution_id="exec")
+    snapshot = recorder.traces
+    recorder.record_event("b", {}, execution_id="exec")
+    assert [event.event_type for event in snapshot] == ["a"]
+
+    recorder.clear_traces()
+    assert recorder.traces == ()
+    assert recorder.get_execution_trace("exec") == []
+
+
+def test_replacing_traces_invalidates_exports():
+    recorder = FlightDataRecorder(enable_otel=False)
+    recorder.record_event("a", {}, execution_id="exec")
+    recorder.record_event("b", {}, execution_id="exec")
+    before = recorder.export_trace("exec")
+
+    recorder.record_event("c", {}, execution_id="exec")
+    a, b, c = recorder.traces
+    # Same count and last event as the cached export, but different events
+    recorder.traces = [c, b]
+
+    after = recorder.export_trace("exec")
+    assert after != before
+    assert '"c"' in after and '"a"' not in after
+
+
+def test_json_export_does_not_depend_on_the_encoder(monkeypatch):
+    from datetime import datetime
+
+    from arbiteros.core import observability
+
+    recorder = FlightDataRecorder(enable_otel=False)
+    recorder.record_event("a", {"when": datetime(2024, 5, 1, 12, 30, 0, 5), "name": "é"}, "i1", "exec")
+    recorder.record_event("b", {}, execution_id="exec")
+    events = recorder.get_execution_trace("exec")
+
+    outputs = [recorder._render_trace(events, "json")]
+    monkeypatch.setattr(observability, "ORJSON_AVAILABLE", not observability.ORJSON_AVAILABLE)
+    outputs.append(recorder._render_trace(events, "json"))
+    # The pydantic encoder (no orjson) and the json.dumps fallback behind it
+    monkeypatch.setattr(observability, "ORJSON_AVAILABLE", False)
+    outputs.append(recorder._render_trace(events, "json"))
+
+    class _Unencodable:
+        def dump_json(self, *args, **kwargs):
+            raise observability.PydanticSerializationError("unencodable")
+
+    monkeypatch.setattr(observability, "_TRACE_EVENTS_ADAPTER", _Unencodable())
+    outputs.append(recorder._render_trace(events, "json"))
+
+    layouts = [[list(event.items()) for event in json.loads(text)] for text in outputs]
+    assert all(layout == layouts[0] for layout in layouts)
+    assert layouts[0][0][-1] == ("timestamp", events[0].timestamp.isoformat())
+
+
+def test_unread_recorder_stays_bounded():
+    recorder = FlightDataRecorder(enable_otel=False, max_events=100)
+    for n in range(5000):
+        recorder.record_event("tick", {"n": n}, execution_id="exec")
+
+    assert recorder._pending.qsize() <= 100
+    assert len(recorder._traces) <= 100
+    assert recorder.traces[-1].data == {"n": 4999}
+
+
+def test_recorded_payload_is_not_changed_by_the_caller():
+    recorder = FlightDataRecorder(enable_otel=False)
+    data = {"k": 1}
+    recorder.record_event("a", data, execution_id="exec")
+    data["k"] = 2
+
+    assert recorder.get_execution_trace("exec")[0].data == {"k": 1}
+
+
+def test_json_export_handles_ints_wider_than_64_bits():
+    recorder = FlightDataRecorder(enable_otel=False)
+    recorder.record_event("a", {"big": 2 ** 70}, execution_id="exec")
+
+    assert json.loads(recorder.export_trace("exec"))[0]["data"] == {"big": 2 ** 70}
+
+
+def test_traces_snapshot_rejects_mutation():
+    recorder = FlightDataRecorder(enable_otel=False)
+    recorder.record_event("a", {}, execution_id="exec")
+
+    with pytest.raises(AttributeError):
+        recorder.traces.append(recorder.traces[0])
+    with pytest.raises(AttributeError):
+        recorder.traces.clear()
+    assert len(recorder.traces) == 1